@@ -2,6 +2,8 @@
 import os
 
 class DatabaseAgent:
+    __slots__ = ("name", "system_message")
+
     def __init__(self, chat_client=None):
         self.name = "Database Agent"
         self.system_message = """You are a database operations expert for MongoDB and Redis.
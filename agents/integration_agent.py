@@ -2,6 +2,8 @@
 import os
 
 class IntegrationAgent:
+    __slots__ = ("name", "system_message")
+
     def __init__(self, chat_client=None):
         self.name = "Integration Agent"
         self.system_message = """You integrate external APIs and services.
@@ -5,14 +5,134 @@ Uses Groq's ultra-fast Llama 3.3 70B model to intelligently route
 requests to the appropriate MCP server based on natural language input.
 """
 
-import os
+import re
+import string
+import asyncio
 import logging
-import json
-from typing import Dict, List, Optional, Any
-from groq import Groq
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Tuple
+import httpx
+import orjson
+from groq import AsyncGroq
+
+from config.settings import (
+    ROUTING_CACHE_SIZE, ROUTING_CACHE_TTL,
+    ROUTER_BATCH_WINDOW_MS, ROUTER_MAX_BATCH, GROQ_API_KEY
+)
+from agents.routing_cache import CacheManager
+from agents.route_batcher import RouteBatcher
+from tools.service_tools import ServiceTools
+from tools.database_tools import DatabaseTools
 
 logger = logging.getLogger(__name__)
 
+# Static parts of the Groq system prompt; the servers description goes in between
+_SYSTEM_PROMPT_HEADER = """You are an intelligent MCP routing agent. Your job is to analyze user requests and determine which MCP server and tool to use.
+
+Available MCP Servers:
+"""
+
+_RESPONSE_FORMAT_TEMPLATE = """Respond with a compact JSON object in this format:
+{"server": "server_name", "tool": "tool_name", "arguments": {"arg1": "value1"}, "multi_step": false, "steps": []}
+
+You may add "reasoning" with at most one short sentence.
+If the request requires multiple steps across servers, set multi_step: true and provide steps array.
+Each step is an object with "id", "server", "tool", "arguments" and "depends_on" (ids of steps that must finish first; [] if independent)."""
+
+_SYSTEM_PROMPT_FOOTER = f"""
+
+Your task:
+1. Understand the user's request
+2. Determine which MCP server is most appropriate
+3. Select the specific tool to call
+4. Extract or infer the required arguments
+
+{_RESPONSE_FORMAT_TEMPLATE}
+
+Be precise and always provide valid JSON."""
+
+# Maps punctuation to spaces for request normalization
+_NORMALIZE_TABLE = str.maketrans({c: " " for c in string.punctuation})
+
+
+def _normalize(text: str) -> str:
+    """Lowercase, strip punctuation and collapse whitespace."""
+    return " ".join(text.lower().translate(_NORMALIZE_TABLE).split())
+
+
+# Local tool name -> handler
+_LOCAL_DISPATCH = {
+    "coordinate_services": ServiceTools.handle,
+    "health_check_all": ServiceTools.handle,
+    "mongo_query": DatabaseTools.handle,
+    "redis_get": DatabaseTools.handle,
+    "redis_set": DatabaseTools.handle,
+}
+
+# Appended to the system prompt when several requests are routed in one call
+_BATCH_INSTRUCTIONS = """
+
+You will receive several numbered requests. Route each one independently and respond with a JSON object of the form {"decisions": [...]}, containing exactly one routing decision per request, in the same order as the requests."""
+
+# Completion token budget per routed request; a compact decision fits in ~80 tokens
+_MAX_TOKENS = 200
+_STOP_SEQUENCES = ["```", "\n\n\n"]
+
+# Fallback routing keywords mapped to their category
+_FALLBACK_KEYWORDS = {
+    "mongo": "mongo",
+    "database": "database",
+    "redis": "database",
+    "query": "database",
+    "cache": "database",
+    "service": "service",
+    "health": "service",
+    "status": "service",
+    "coordinate": "service",
+}
+_FALLBACK_PATTERN = re.compile("|".join(map(re.escape, _FALLBACK_KEYWORDS)))
+
+# Fallback decisions are shared between calls and must be treated as read-only
+_MONGO_DECISION = {
+    "server": "local",
+    "tool": "mongo_query",
+    "arguments": {},
+    "reasoning": "Detected database-related keywords",
+    "confidence": 0.6,
+    "multi_step": False
+}
+_DATABASE_DECISION = {
+    "server": "local",
+    "tool": "redis_get",
+    "arguments": {},
+    "reasoning": "Detected database-related keywords",
+    "confidence": 0.6,
+    "multi_step": False
+}
+_SERVICE_DECISION = {
+    "server": "local",
+    "tool": "health_check_all",
+    "arguments": {},
+    "reasoning": "Detected service coordination keywords",
+    "confidence": 0.6,
+    "multi_step": False
+}
+_DEFAULT_DECISION = {
+    "server": "local",
+    "tool": "coordinate_services",
+    "arguments": {"operation": "help"},
+    "reasoning": "No specific routing match, using default",
+    "confidence": 0.3,
+    "multi_step": False
+}
+
+# Category -> decision, in priority order
+_FALLBACK_DECISIONS = (
+    ("mongo", _MONGO_DECISION),
+    ("database", _DATABASE_DECISION),
+    ("service", _SERVICE_DECISION),
+)
+
 
 class IntelligentRouterAgent:
     """
@@ -25,21 +145,63 @@ class IntelligentRouterAgent:
     - Coordinating multi-server operations
     """
 
+    __slots__ = (
+        "federation_manager", "groq_client", "_http_client", "model",
+        "cache", "_cache_version", "_servers_context_for", "_system_prompt_for",
+        "_batcher", "_inflight"
+    )
+
     def __init__(self, federation_manager=None):
         """Initialize the router agent."""
         self.federation_manager = federation_manager
 
         # Initialize Groq client
-        api_key = os.getenv("GROQ_API_KEY")
+        api_key = GROQ_API_KEY
         if not api_key:
             logger.warning("No GROQ_API_KEY found - router will use fallback logic")
             self.groq_client = None
+            self._http_client = None
         else:
-            self.groq_client = Groq(api_key=api_key)
+            # Shared HTTP/2 pool so concurrent routing calls multiplex to api.groq.com
+            self._http_client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_connections=100)
+            )
+            self.groq_client = AsyncGroq(api_key=api_key, http_client=self._http_client)
             logger.info("Groq client initialized with Llama 3.3 70B")
 
         self.model = "llama-3.3-70b-versatile"  # Ultra-fast model
 
+        # Cache of routing decisions keyed by normalized request text
+        self.cache = CacheManager(
+            max_entries=ROUTING_CACHE_SIZE,
+            ttl=ROUTING_CACHE_TTL
+        )
+        self._cache_version = 0
+
+        # Servers context and system prompt only change with the federation version
+        self._servers_context_for = lru_cache(maxsize=8)(self._build_servers_context)
+        self._system_prompt_for = lru_cache(maxsize=8)(self._build_versioned_system_prompt)
+
+        # Normalized request -> task routing it, for in-flight deduplication
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+        # Coalesce concurrent Groq calls (disabled with a zero window)
+        self._batcher = None
+        if self.groq_client and ROUTER_BATCH_WINDOW_MS > 0:
+            self._batcher = RouteBatcher(
+                self._route_with_groq,
+                self._route_batch_with_groq,
+                max_batch=ROUTER_MAX_BATCH,
+                window_ms=ROUTER_BATCH_WINDOW_MS
+            )
+
+    def _servers_version(self) -> int:
+        """Current federation version (0 when no federation manager)."""
+        if not self.federation_manager:
+            return 0
+        return self.federation_manager.version
+
     async def route_request(
         self,
         user_request: str,
@@ -53,43 +215,100 @@ class IntelligentRouterAgent:
             context: Additional context about the request
 
         Returns:
-            Routing decision with server, tool, and arguments
+            Routing decision with server, tool, and arguments. Identical
+            concurrent requests share one decision, so treat it as read-only.
         """
         if not self.groq_client:
             return await self._fallback_routing(user_request)
 
-        # Get available servers and their capabilities
-        servers_info = self._get_servers_context()
-
-        # Build prompt for Groq
-        system_prompt = self._build_system_prompt(servers_info)
-        user_prompt = self._build_user_prompt(user_request, context)
-
+        version = self._servers_version()
+        if version != self._cache_version:
+            # Cached decisions may reference servers that changed
+            self.cache.clear()
+            self._cache_version = version
+
+        # Context changes the decision, so only context-free requests are cached
+        cache_key = None if context else _normalize(user_request)
+        if cache_key:
+            cached = self.cache.get_cache(cache_key)
+            if cached is not None:
+                logger.debug("Routing cache hit: %s", cache_key)
+                return cached
+
+            # Identical requests already being routed share one Groq call
+            task = self._inflight.get(cache_key)
+            if task is None:
+                task = asyncio.ensure_future(self._route_uncached(user_request, context, cache_key))
+                self._inflight[cache_key] = task
+                task.add_done_callback(lambda _: self._inflight.pop(cache_key, None))
+            return await asyncio.shield(task)
+
+        return await self._route_uncached(user_request, context, None)
+
+    async def _route_uncached(
+        self,
+        user_request: str,
+        context: Optional[Dict],
+        cache_key: Optional[str]
+    ) -> Dict[str, Any]:
+        """Route a request via Groq, falling back to keyword routing on error."""
         try:
-            # Call Groq for intelligent routing
-            response = self.groq_client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                temperature=0.1,  # Low temperature for consistent routing
-                max_tokens=1000,
-                response_format={"type": "json_object"}
-            )
-
-            # Parse routing decision
-            decision = json.loads(response.choices[0].message.content)
-
-            logger.info(f"Routing decision: {decision}")
+            # Call Groq for intelligent routing, batched with concurrent requests
+            if self._batcher:
+                decision = await self._batcher.submit(user_request, context)
+            else:
+                decision = await self._route_with_groq(user_request, context)
+
+            logger.info("Routing decision: %s", decision)
+            if cache_key:
+                self.cache.put_cache(cache_key, decision)
             return decision
 
         except Exception as e:
-            logger.error(f"Error in intelligent routing: {e}")
+            logger.error("Error in intelligent routing: %s", e)
             return await self._fallback_routing(user_request)
 
+    async def _complete_json(self, system_prompt: str, user_prompt: str, max_tokens: int) -> Any:
+        """Run a JSON-mode Groq completion and parse the result."""
+        response = await self.groq_client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ],
+            temperature=0.1,  # Low temperature for consistent routing
+            max_tokens=max_tokens,
+            stop=_STOP_SEQUENCES,
+            response_format={"type": "json_object"}
+        )
+
+        return orjson.loads(response.choices[0].message.content)
+
+    async def _route_with_groq(self, user_request: str, context: Optional[Dict]) -> Dict[str, Any]:
+        """Get a routing decision for a single request from Groq."""
+        return await self._complete_json(
+            self._system_prompt_for(self._servers_version()),
+            self._build_user_prompt(user_request, context),
+            _MAX_TOKENS
+        )
+
+    async def _route_batch_with_groq(self, items: List[Tuple[str, Optional[Dict]]]) -> List[Dict[str, Any]]:
+        """Get routing decisions for several requests from one Groq call."""
+        system_prompt = self._system_prompt_for(self._servers_version()) + _BATCH_INSTRUCTIONS
+        user_prompt = "\n\n".join(
+            f"### Request {i}\n{self._build_user_prompt(user_request, context)}"
+            for i, (user_request, context) in enumerate(items, 1)
+        )
+
+        result = await self._complete_json(system_prompt, user_prompt, _MAX_TOKENS * len(items))
+        return result["decisions"]
+
     def _get_servers_context(self) -> List[Dict]:
         """Get context about available MCP servers and their tools."""
+        return self._servers_context_for(self._servers_version())
+
+    def _build_servers_context(self, version: int) -> List[Dict]:
+        """Build the servers context for a federation version."""
         if not self.federation_manager:
             return []
 
@@ -98,28 +317,33 @@ class IntelligentRouterAgent:
             if not config.is_healthy or not config.enabled:
                 continue
 
-            server_info = {
-                "name": server_name,
-                "description": config.description,
-                "tools": [
-                    {
-                        "name": tool["name"],
-                        "description": tool.get("description", "")
-                    }
-                    for tool in config.tools
-                ],
-                "resources": [
-                    {
-                        "uri": res.get("uri", ""),
-                        "description": res.get("name", "")
-                    }
-                    for res in config.resources
-                ]
-            }
-            servers.append(server_info)
+            if config._router_view is None:
+                config._router_view = {
+                    "name": server_name,
+                    "description": config.description,
+                    "tools": [
+                        {
+                            "name": tool["name"],
+                            "description": tool.get("description", "")
+                        }
+                        for tool in config.tools
+                    ],
+                    "resources": [
+                        {
+                            "uri": res.get("uri", ""),
+                            "description": res.get("name", "")
+                        }
+                        for res in config.resources
+                    ]
+                }
+            servers.append(config._router_view)
 
         return servers
 
+    def _build_versioned_system_prompt(self, version: int) -> str:
+        """Build the system prompt for a federation version."""
+        return self._build_system_prompt(self._servers_context_for(version))
+
     def _build_system_prompt(self, servers_info: List[Dict]) -> str:
         """Build system prompt for Groq."""
         servers_description = "\n\n".join([
@@ -129,31 +353,7 @@ class IntelligentRouterAgent:
             for s in servers_info
         ])
 
-        return f"""You are an intelligent MCP routing agent. Your job is to analyze user requests and determine which MCP server and tool to use.
-
-Available MCP Servers:
-{servers_description}
-
-Your task:
-1. Understand the user's request
-2. Determine which MCP server is most appropriate
-3. Select the specific tool to call
-4. Extract or infer the required arguments
-
-Respond with a JSON object in this format:
-{{
-  "server": "server_name",
-  "tool": "tool_name",
-  "arguments": {{"arg1": "value1", "arg2": "value2"}},
-  "reasoning": "Brief explanation of routing decision",
-  "confidence": 0.95,
-  "multi_step": false,
-  "steps": []
-}}
-
-If the request requires multiple steps across servers, set multi_step: true and provide steps array.
-
-Be precise and always provide valid JSON."""
+        return f"{_SYSTEM_PROMPT_HEADER}{servers_description}{_SYSTEM_PROMPT_FOOTER}"
 
     def _build_user_prompt(
         self,
@@ -164,7 +364,8 @@ Be precise and always provide valid JSON."""
         prompt = f"User Request: {user_request}"
 
         if context:
-            prompt += f"\n\nContext:\n{json.dumps(context, indent=2)}"
+            context_json = orjson.dumps(context, option=orjson.OPT_INDENT_2, default=str).decode()
+            prompt += f"\n\nContext:\n{context_json}"
 
         prompt += "\n\nPlease route this request to the appropriate MCP server and tool."
 
@@ -174,40 +375,15 @@ Be precise and always provide valid JSON."""
         """Fallback routing logic when Groq is not available."""
         logger.info("Using fallback routing logic")
 
-        # Simple keyword-based routing
-        request_lower = user_request.lower()
-
-        # Database operations
-        if any(word in request_lower for word in ["database", "mongo", "redis", "query", "cache"]):
-            return {
-                "server": "local",
-                "tool": "mongo_query" if "mongo" in request_lower else "redis_get",
-                "arguments": {},
-                "reasoning": "Detected database-related keywords",
-                "confidence": 0.6,
-                "multi_step": False
-            }
+        # Simple keyword-based routing: one compiled pass classifies the request
+        request_normalized = _normalize(user_request)
+        matched = {_FALLBACK_KEYWORDS[word] for word in _FALLBACK_PATTERN.findall(request_normalized)}
 
-        # Service coordination
-        if any(word in request_lower for word in ["service", "health", "status", "coordinate"]):
-            return {
-                "server": "local",
-                "tool": "health_check_all",
-                "arguments": {},
-                "reasoning": "Detected service coordination keywords",
-                "confidence": 0.6,
-                "multi_step": False
-            }
+        for category, decision in _FALLBACK_DECISIONS:
+            if category in matched:
+                return decision
 
-        # Default fallback
-        return {
-            "server": "local",
-            "tool": "coordinate_services",
-            "arguments": {"operation": "help"},
-            "reasoning": "No specific routing match, using default",
-            "confidence": 0.3,
-            "multi_step": False
-        }
+        return _DEFAULT_DECISION
 
     async def execute_routing(self, routing_decision: Dict[str, Any]) -> Any:
         """
@@ -234,13 +410,9 @@ Be precise and always provide valid JSON."""
         # Single step execution
         if server == "local":
             # Handle local tools
-            from tools.service_tools import ServiceTools
-            from tools.database_tools import DatabaseTools
-
-            if tool in ["coordinate_services", "health_check_all"]:
-                return await ServiceTools.handle(tool, arguments)
-            elif tool in ["mongo_query", "redis_get", "redis_set"]:
-                return await DatabaseTools.handle(tool, arguments)
+            handler = _LOCAL_DISPATCH.get(tool)
+            if handler:
+                return await handler(tool, arguments)
 
         else:
             # Route to external MCP server
@@ -252,18 +424,83 @@ Be precise and always provide valid JSON."""
             return result
 
     async def _execute_multi_step(self, steps: List[Dict]) -> List[Any]:
-        """Execute multiple routing steps in sequence."""
-        results = []
+        """
+        Execute multiple routing steps.
 
-        for step in steps:
-            result = await self.execute_routing(step)
-            results.append({
-                "step": step,
-                "result": result
-            })
+        Steps are grouped into dependency levels from their optional
+        "depends_on" lists and each level runs concurrently. If no step
+        declares dependencies they run in sequence, as listed.
+        """
+        if not any("depends_on" in step for step in steps):
+            results = []
+            for step in steps:
+                result = await self.execute_routing(step)
+                results.append({
+                    "step": step,
+                    "result": result
+                })
+            return results
+
+        results: List[Any] = [None] * len(steps)
+        for level in self._dependency_levels(steps):
+            level_results = await asyncio.gather(
+                *[self.execute_routing(steps[i]) for i in level]
+            )
+            for i, result in zip(level, level_results):
+                results[i] = {
+                    "step": steps[i],
+                    "result": result
+                }
 
         return results
 
+    @staticmethod
+    def _dependency_levels(steps: List[Dict]) -> List[List[int]]:
+        """Topologically sort steps into levels of mutually independent step indexes."""
+        ids = [str(step.get("id", index)) for index, step in enumerate(steps)]
+        index_of = {step_id: index for index, step_id in enumerate(ids)}
+
+        # Dependencies on unknown step ids are ignored
+        pending = {
+            index: {
+                index_of[str(dep)]
+                for dep in step.get("depends_on") or []
+                if str(dep) in index_of and index_of[str(dep)] != index
+            }
+            for index, step in enumerate(steps)
+        }
+
+        levels = []
+        while pending:
+            level = [index for index, deps in pending.items() if not deps]
+            if not level:
+                raise ValueError("Cyclic dependencies between routing steps")
+            for index in level:
+                del pending[index]
+            for deps in pending.values():
+                deps.difference_update(level)
+            levels.append(level)
+
+        return levels
+
+    async def warmup(self):
+        """Open the Groq connection ahead of the first routed request."""
+        if not self.groq_client:
+            return
+
+        try:
+            await asyncio.wait_for(self.groq_client.models.list(), 2.0)
+            logger.info("Groq connection warmed up")
+        except Exception as e:
+            logger.warning("Groq warmup failed: %s", e)
+
+    async def close(self):
+        """Stop request batching and close the Groq HTTP client."""
+        if self._batcher:
+            await self._batcher.close()
+        if self._http_client:
+            await self._http_client.aclose()
+
     async def run(self, request: str, context: Optional[Dict] = None) -> Dict[str, Any]:
         """
         Main entry point: route and execute request.
@@ -289,7 +526,7 @@ Be precise and always provide valid JSON."""
             }
 
         except Exception as e:
-            logger.error(f"Error executing routing: {e}")
+            logger.error("Error executing routing: %s", e)
             return {
                 "success": False,
                 "routing": routing,
@@ -12,6 +12,8 @@ from typing import Optional
 class MCPCoordinatorAgent:
     """Agent specialized in MCP protocol coordination."""
 
+    __slots__ = ("name", "role", "system_message", "_system_message_summary", "agent")
+
     def __init__(self, chat_client=None):
         """Initialize the MCP coordinator agent."""
         self.name = "MCP Coordinator"
@@ -62,6 +64,7 @@ When coordinating operations:
 
         # Store system message for coordination logic
         self.system_message = system_message
+        self._system_message_summary = f"{system_message[:200]}..."
         self.agent = None  # Using lightweight coordination without external frameworks
 
     async def coordinate_operation(self, operation: str, context: dict) -> str:
@@ -111,7 +114,7 @@ Note: Full AI coordination requires API keys."""
         """Run the agent with a task."""
         if self.agent:
             return await self.agent.run(task)
-        return f"{self.name}: {task}\n\n{self.system_message[:200]}..."
+        return f"{self.name}: {task}\n\n{self._system_message_summary}"
 
     async def run_stream(self, task: str):
         """Run agent with streaming output."""
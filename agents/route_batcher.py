@@ -0,0 +1,135 @@
+"""
+Routing Request Batcher
+
+Coalesces concurrent routing requests that arrive within a short window
+into a single batched LLM call.
+"""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+RouteItem = Tuple[str, Optional[Dict]]
+
+
+def _fail(future: asyncio.Future, error: Exception):
+    """Resolve a caller's future with an error unless it already has a result."""
+    if not future.done():
+        future.set_exception(error)
+
+
+class RouteBatcher:
+    """
+    Micro-batcher for routing requests.
+
+    Requests are queued and a background worker collects up to
+    `max_batch` of them, waiting at most `window_ms` after the first one.
+    A batch of one is routed with `route_one`; larger batches go through
+    `route_many`, which must return one decision per item, in order.
+    """
+
+    def __init__(
+        self,
+        route_one: Callable[[str, Optional[Dict]], Awaitable[Dict]],
+        route_many: Callable[[List[RouteItem]], Awaitable[List[Dict]]],
+        max_batch: int = 8,
+        window_ms: float = 10.0
+    ):
+        """Initialize the batcher."""
+        self._route_one = route_one
+        self._route_many = route_many
+        self.max_batch = max_batch
+        self.window = window_ms / 1000
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._dispatches: Set[asyncio.Task] = set()
+
+    async def submit(self, user_request: str, context: Optional[Dict] = None) -> Dict:
+        """Queue a routing request and wait for its decision."""
+        if self._worker is None:
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._collect())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put(((user_request, context), future))
+        return await future
+
+    async def close(self):
+        """Stop the background worker and fail every routing request still pending."""
+        if self._worker:
+            self._worker.cancel()
+            await asyncio.gather(self._worker, return_exceptions=True)
+            self._worker = None
+
+        dispatches = tuple(self._dispatches)
+        for task in dispatches:
+            task.cancel()
+        await asyncio.gather(*dispatches, return_exceptions=True)
+
+        if self._queue:
+            while not self._queue.empty():
+                _, future = self._queue.get_nowait()
+                _fail(future, RuntimeError("Route batcher closed"))
+            self._queue = None
+
+    async def _collect(self):
+        """Background task that groups queued requests into batches."""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = []
+            try:
+                batch.append(await self._queue.get())
+                deadline = loop.time() + self.window
+
+                while len(batch) < self.max_batch:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+
+                # Dispatch without waiting so the next batch can fill meanwhile
+                task = asyncio.create_task(self._dispatch(batch))
+                self._dispatches.add(task)
+                task.add_done_callback(self._dispatches.discard)
+
+            except asyncio.CancelledError:
+                # Requests taken off the queue but not yet dispatched
+                for _, future in batch:
+                    _fail(future, RuntimeError("Route batcher closed"))
+                break
+            except Exception as e:
+                logger.error("Error in route batcher: %s", e)
+
+    async def _dispatch(self, batch: List[Tuple[RouteItem, asyncio.Future]]):
+        """Route a batch and resolve each caller's future."""
+        items = [item for item, _ in batch]
+        futures = [future for _, future in batch]
+
+        try:
+            if len(items) == 1:
+                decisions = [await self._route_one(*items[0])]
+            else:
+                decisions = await self._route_many(items)
+                if len(decisions) != len(items):
+                    raise ValueError(
+                        f"Expected {len(items)} routing decisions, got {len(decisions)}"
+                    )
+        except asyncio.CancelledError:
+            for future in futures:
+                _fail(future, RuntimeError("Route batcher closed"))
+            raise
+        except Exception as e:
+            for future in futures:
+                _fail(future, e)
+            return
+
+        for future, decision in zip(futures, decisions):
+            if not future.done():
+                future.set_result(decision)
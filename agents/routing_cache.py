@@ -0,0 +1,72 @@
+"""
+Routing Decision Cache
+
+Caches routing decisions produced by the IntelligentRouterAgent so that
+repeated requests can skip the Groq round-trip.
+"""
+
+import copy
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+
+class CacheManager:
+    """
+    Exact-match cache of routing decisions.
+
+    Keys are expected to be normalized by the caller. Only identical
+    normalized requests share a decision: near-duplicates usually differ in
+    the arguments (keys, ids, names) the decision carries.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl: float = 300.0
+    ):
+        """Initialize the cache."""
+        self.max_entries = max_entries
+        self.ttl = ttl
+
+        # key -> (decision, expires_at), oldest first
+        self._entries: "OrderedDict[str, Tuple[Dict, float]]" = OrderedDict()
+
+    def get_cache(self, key: str) -> Optional[Dict]:
+        """
+        Look up a routing decision for a normalized request.
+
+        Args:
+            key: Normalized request text
+
+        Returns:
+            A copy of the cached decision, or None on miss
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        if entry[1] <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return copy.deepcopy(entry[0])
+
+    def put_cache(self, key: str, decision: Dict):
+        """Store a copy of a routing decision for a normalized request."""
+        if not key:
+            return
+
+        self._entries[key] = (copy.deepcopy(decision), time.monotonic() + self.ttl)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop all cached decisions."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
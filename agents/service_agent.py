@@ -2,6 +2,8 @@
 import os
 
 class ServiceAgent:
+    __slots__ = ("name", "system_message")
+
     def __init__(self, chat_client=None):
         self.name = "Service Agent"
         self.system_message = """You coordinate service-to-service communication in Northflank.
@@ -2,6 +2,8 @@
 import os
 
 class WorkflowAgent:
+    __slots__ = ("name", "system_message")
+
     def __init__(self, chat_client=None):
         self.name = "Workflow Agent"
         self.system_message = """You orchestrate complex multi-step workflows.
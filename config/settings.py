@@ -1,30 +1,108 @@
 """Configuration settings for MCP Hub"""
 import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Tuple
 from dotenv import load_dotenv
 
-load_dotenv()
 
-# Server settings
-SERVER_NAME = os.getenv("MCP_SERVER_NAME", "northflank-mcp-hub")
-SERVER_VERSION = os.getenv("MCP_SERVER_VERSION", "1.0.0")
-PORT = int(os.getenv("PORT", 8080))
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Process-wide settings, read from the environment once."""
+    # Server settings
+    server_name: str
+    server_version: str
+    port: int
 
-# API Keys
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY")
+    # API Keys
+    openai_api_key: Optional[str]
+    anthropic_api_key: Optional[str]
+    groq_api_key: Optional[str]
 
-# Northflank Services (support both direct and NF_* prefixed vars)
-MONGO_URI = os.getenv("MONGO_URI") or os.getenv("NF_MONGODB_LIBRECHAT_MONGO_SRV")
-REDIS_URI = os.getenv("REDIS_URI") or os.getenv("NF_REDIS_CACHE_REDIS_MASTER_URL")
-POSTGRES_URI = os.getenv("POSTGRES_URI") or os.getenv("NF_POSTGRES_DB_POSTGRES_URI")
-RABBITMQ_URI = os.getenv("RABBITMQ_URI") or os.getenv("NF_RABBITMQ_AMQP_CONNECTION_STRING")
-MINIO_URL = os.getenv("MINIO_URL") or os.getenv("NF_MINIO_MINIO_ENDPOINT")
-MINIO_ACCESS_KEY = os.getenv("MINIO_ACCESS_KEY") or os.getenv("NF_MINIO_ACCESS_KEY")
-MINIO_SECRET_KEY = os.getenv("MINIO_SECRET_KEY") or os.getenv("NF_MINIO_SECRET_KEY")
-LIBRECHAT_URL = os.getenv("LIBRECHAT_URL", "https://web--librechat--5d689c8h7r47.code.run")
+    # Northflank Services
+    mongo_uri: Optional[str]
+    redis_uri: Optional[str]
+    postgres_uri: Optional[str]
+    rabbitmq_uri: Optional[str]
+    minio_url: Optional[str]
+    minio_access_key: Optional[str]
+    minio_secret_key: Optional[str]
+    librechat_url: str
 
-# CORS
-ALLOWED_ORIGINS = os.getenv("ALLOWED_ORIGINS", "http://localhost:3080,https://web--librechat--5d689c8h7r47.code.run").split(",")
+    # Intelligent router decision cache
+    routing_cache_size: int
+    routing_cache_ttl: float
 
-# Logging
-LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+    # Intelligent router request batching
+    router_batch_window_ms: float
+    router_max_batch: int
+
+    # CORS
+    allowed_origins: Tuple[str, ...]
+
+    # Logging
+    log_level: str
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Load settings from the environment (and .env) on first use."""
+    load_dotenv()
+    env = os.environ.get
+
+    return Settings(
+        server_name=env("MCP_SERVER_NAME", "northflank-mcp-hub"),
+        server_version=env("MCP_SERVER_VERSION", "1.0.0"),
+        port=int(env("PORT", 8080)),
+        openai_api_key=env("OPENAI_API_KEY"),
+        anthropic_api_key=env("ANTHROPIC_API_KEY"),
+        groq_api_key=env("GROQ_API_KEY"),
+        # Support both direct and NF_* prefixed vars (and AWS_* for MinIO)
+        mongo_uri=env("MONGO_URI") or env("NF_MONGODB_LIBRECHAT_MONGO_SRV"),
+        redis_uri=env("REDIS_URI") or env("NF_REDIS_CACHE_REDIS_MASTER_URL"),
+        postgres_uri=env("POSTGRES_URI") or env("NF_POSTGRES_DB_POSTGRES_URI"),
+        rabbitmq_uri=env("RABBITMQ_URI") or env("NF_RABBITMQ_AMQP_CONNECTION_STRING"),
+        minio_url=env("MINIO_URL") or env("NF_MINIO_MINIO_ENDPOINT") or env("AWS_ENDPOINT_URL"),
+        minio_access_key=env("MINIO_ACCESS_KEY") or env("NF_MINIO_ACCESS_KEY") or env("AWS_ACCESS_KEY_ID"),
+        minio_secret_key=env("MINIO_SECRET_KEY") or env("NF_MINIO_SECRET_KEY") or env("AWS_SECRET_ACCESS_KEY"),
+        librechat_url=env("LIBRECHAT_URL", "https://web--librechat--5d689c8h7r47.code.run"),
+        routing_cache_size=int(env("ROUTING_CACHE_SIZE", "1024")),
+        routing_cache_ttl=float(env("ROUTING_CACHE_TTL", "300")),
+        router_batch_window_ms=float(env("ROUTER_BATCH_WINDOW_MS", "10")),
+        router_max_batch=int(env("ROUTER_MAX_BATCH", "8")),
+        allowed_origins=tuple(
+            env("ALLOWED_ORIGINS", "http://localhost:3080,https://web--librechat--5d689c8h7r47.code.run").split(",")
+        ),
+        log_level=env("LOG_LEVEL", "INFO"),
+    )
+
+
+_settings = get_settings()
+
+# Module-level aliases for existing imports
+SERVER_NAME = _settings.server_name
+SERVER_VERSION = _settings.server_version
+PORT = _settings.port
+
+OPENAI_API_KEY = _settings.openai_api_key
+ANTHROPIC_API_KEY = _settings.anthropic_api_key
+GROQ_API_KEY = _settings.groq_api_key
+
+MONGO_URI = _settings.mongo_uri
+REDIS_URI = _settings.redis_uri
+POSTGRES_URI = _settings.postgres_uri
+RABBITMQ_URI = _settings.rabbitmq_uri
+MINIO_URL = _settings.minio_url
+MINIO_ACCESS_KEY = _settings.minio_access_key
+MINIO_SECRET_KEY = _settings.minio_secret_key
+LIBRECHAT_URL = _settings.librechat_url
+
+ROUTING_CACHE_SIZE = _settings.routing_cache_size
+ROUTING_CACHE_TTL = _settings.routing_cache_ttl
+
+ROUTER_BATCH_WINDOW_MS = _settings.router_batch_window_ms
+ROUTER_MAX_BATCH = _settings.router_max_batch
+
+ALLOWED_ORIGINS = _settings.allowed_origins
+
+LOG_LEVEL = _settings.log_level
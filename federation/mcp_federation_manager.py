@@ -6,17 +6,68 @@ unified tool/resource access across all registered servers.
 """
 
 import asyncio
+import itertools
 import logging
-from typing import Dict, List, Optional, Any
+import time
+from typing import Dict, List, Optional, Any, Set, Tuple
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 import httpx
-import json
+import orjson
+from cachetools import TTLCache
 
 logger = logging.getLogger(__name__)
 
+_PING_REQUEST = orjson.dumps({"jsonrpc": "2.0", "method": "ping", "id": 1})
 
-@dataclass
+# Read-only methods whose results can be served from the response cache
+_CACHEABLE_METHODS = frozenset(("tools/list", "resources/list", "resources/read"))
+
+
+# JSON-RPC error code for a method the server does not implement
+_METHOD_NOT_FOUND = -32601
+
+
+class MCPMethodError(Exception):
+    """A JSON-RPC error reply from an MCP server."""
+
+    def __init__(self, error: Any):
+        super().__init__(f"MCP error: {error}")
+        self.code = error.get("code") if isinstance(error, dict) else None
+
+
+def _fail(future: asyncio.Future, error: Exception):
+    """Fail a caller's future unless it is already resolved."""
+    if not future.done():
+        future.set_exception(error)
+
+
+def _resolve(future: asyncio.Future, reply: Optional[Dict], request_id: int):
+    """Resolve a caller's future from its JSON-RPC reply."""
+    if future.done():
+        return
+    if not isinstance(reply, dict):
+        future.set_exception(Exception(f"MCP error: no response for request {request_id}"))
+    elif "error" in reply:
+        future.set_exception(MCPMethodError(reply["error"]))
+    else:
+        future.set_result(reply.get("result"))
+
+
+def _batch_replies(response: httpx.Response) -> Optional[Dict[Any, Dict]]:
+    """Replies to a batch keyed by id, or None if the server rejected the batch."""
+    if response.is_error:
+        return None
+    try:
+        data = orjson.loads(response.content)
+    except orjson.JSONDecodeError:
+        return None
+    if not isinstance(data, list):
+        return None
+    return {reply.get("id"): reply for reply in data if isinstance(reply, dict)}
+
+
+@dataclass(slots=True)
 class MCPServerConfig:
     """Configuration for an external MCP server."""
     name: str
@@ -28,12 +79,80 @@ class MCPServerConfig:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
     # Runtime state
-    last_health_check: Optional[datetime] = None
+    last_health_check: Optional[float] = None  # time.monotonic()
+    last_health_check_wall: Optional[float] = None  # time.time(), for display
     is_healthy: bool = False
     tools: List[Dict] = field(default_factory=list)
     resources: List[Dict] = field(default_factory=list)
     error_count: int = 0
 
+    # Server-reported capabilities version (ETag) and monotonic time of last full discovery
+    capabilities_version: Optional[str] = None
+    last_discovery: float = 0.0
+
+    # Circuit breaker: monotonic time of the next health check and current backoff
+    next_check_at: float = 0.0
+    backoff_seconds: float = 30.0
+
+    # Whether the server accepts JSON-RPC batches (None until a batch is first sent)
+    supports_batch: Optional[bool] = None
+
+    # Namespaced copies of tools/resources, rebuilt at discovery when they change
+    _namespaced_tools: List[Dict] = field(default_factory=list, init=False, repr=False, compare=False)
+    _namespaced_resources: List[Dict] = field(default_factory=list, init=False, repr=False, compare=False)
+
+    # Router-facing summary of tools/resources, rebuilt lazily after they change
+    _router_view: Optional[Dict] = field(default=None, init=False, repr=False, compare=False)
+
+    # Request headers, built once from the auth settings
+    _headers: Dict[str, str] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.set_auth(self.auth_type, self.auth_token)
+
+    def set_auth(self, auth_type: Optional[str], auth_token: Optional[str]):
+        """Update authentication and rebuild the request headers."""
+        self.auth_type = auth_type
+        self.auth_token = auth_token
+
+        headers = {"Content-Type": "application/json"}
+
+        # Add authentication if configured
+        if auth_type == "bearer" and auth_token:
+            headers["Authorization"] = f"Bearer {auth_token}"
+        elif auth_type == "api_key" and auth_token:
+            headers["X-API-Key"] = auth_token
+
+        self._headers = headers
+
+
+def _namespace_tools(server_name: str, tools: List[Dict]) -> List[Dict]:
+    """Build the namespaced form of a server's tools."""
+    return [
+        {
+            "name": f"{server_name}.{tool['name']}",
+            "description": f"[{server_name}] {tool.get('description', '')}",
+            "server": server_name,
+            "original_name": tool["name"],
+            "inputSchema": tool.get("inputSchema", {})
+        }
+        for tool in tools
+    ]
+
+
+def _namespace_resources(server_name: str, resources: List[Dict]) -> List[Dict]:
+    """Build the namespaced form of a server's resources."""
+    return [
+        {
+            "uri": f"{server_name}://{resource.get('uri', '')}",
+            "name": f"[{server_name}] {resource.get('name', '')}",
+            "server": server_name,
+            "original_uri": resource.get("uri", ""),
+            "mimeType": resource.get("mimeType", "application/json")
+        }
+        for resource in resources
+    ]
+
 
 class MCPFederationManager:
     """
@@ -53,12 +172,44 @@ class MCPFederationManager:
         self._http_client: Optional[httpx.AsyncClient] = None
         self._health_check_task: Optional[asyncio.Task] = None
         self._health_check_interval = 30  # seconds
+        self._max_backoff = 600  # seconds between checks of a persistently failing server
+        self._discovery_interval = 300  # seconds between full re-discoveries of a healthy server
+
+        # JSON-RPC calls queued per server and sent together as one array batch
+        self._batch_window = 0.002  # seconds
+        self._batch_queues: Dict[str, List[Tuple[Dict, asyncio.Future]]] = {}
+        self._batch_sends: Set[asyncio.Task] = set()
+        self._request_ids = itertools.count(1)
+
+        # Short-lived cache of read-only call results, keyed by (server, method, params)
+        self._response_cache: TTLCache = TTLCache(maxsize=1024, ttl=30)
+
+        # Bumped whenever the set of usable servers or their capabilities changes
+        self.version = 0
+
+        # Namespaced tool/resource lists, valid while their version matches
+        self._tools_cache: Optional[Tuple[int, List[Dict]]] = None
+        self._resources_cache: Optional[Tuple[int, List[Dict]]] = None
 
         logger.info("MCP Federation Manager initialized")
 
     async def start(self):
         """Start the federation manager."""
-        self._http_client = httpx.AsyncClient(timeout=30.0)
+        # Pooled HTTP/2 connections let concurrent calls to a server share one
+        # connection; the transport retries transient connect failures
+        transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            retries=2,
+            limits=httpx.Limits(
+                max_keepalive_connections=100,
+                max_connections=200,
+                keepalive_expiry=60
+            )
+        )
+        self._http_client = httpx.AsyncClient(
+            transport=transport,
+            timeout=httpx.Timeout(30.0, connect=5.0, write=10.0, pool=5.0)
+        )
 
         # Start background health monitoring
         self._health_check_task = asyncio.create_task(self._health_monitor())
@@ -70,6 +221,9 @@ class MCPFederationManager:
         if self._health_check_task:
             self._health_check_task.cancel()
 
+        for task in list(self._batch_sends):
+            task.cancel()
+
         if self._http_client:
             await self._http_client.aclose()
 
@@ -112,26 +266,43 @@ class MCPFederationManager:
             await self._discover_server_capabilities(config)
 
             self.servers[name] = config
-            logger.info(f"Registered MCP server: {name} ({url})")
-            logger.info(f"  - {len(config.tools)} tools discovered")
-            logger.info(f"  - {len(config.resources)} resources discovered")
+            self._bump_version()
+            logger.info("Registered MCP server: %s (%s)", name, url)
+            logger.info("  - %s tools discovered", len(config.tools))
+            logger.info("  - %s resources discovered", len(config.resources))
 
             return True
 
         except Exception as e:
-            logger.error(f"Failed to register server {name}: {e}")
+            logger.error("Failed to register server %s: %s", name, e)
             return False
 
     async def unregister_server(self, name: str) -> bool:
         """Unregister an MCP server."""
         if name in self.servers:
             del self.servers[name]
-            logger.info(f"Unregistered MCP server: {name}")
+            self._invalidate_responses(name)
+            self._bump_version()
+            logger.info("Unregistered MCP server: %s", name)
             return True
         return False
 
+    def _invalidate_responses(self, server_name: str):
+        """Drop cached call results for a server."""
+        for key in [key for key in self._response_cache if key[0] == server_name]:
+            self._response_cache.pop(key, None)
+
+    def _bump_version(self):
+        """Record a change in the servers' routable capabilities."""
+        self.version += 1
+
     async def _discover_server_capabilities(self, config: MCPServerConfig):
         """Discover tools and resources from an MCP server."""
+        changed = not config.is_healthy
+
+        # Discovery must see the server's current state, not cached listings
+        self._invalidate_responses(config.name)
+
         # List tools
         tools_response = await self._call_mcp_method(
             config,
@@ -139,7 +310,11 @@ class MCPFederationManager:
             {}
         )
         if tools_response and "tools" in tools_response:
-            config.tools = tools_response["tools"]
+            if tools_response["tools"] != config.tools:
+                config.tools = tools_response["tools"]
+                config._namespaced_tools = _namespace_tools(config.name, config.tools)
+                config._router_view = None
+                changed = True
 
         # List resources
         try:
@@ -148,14 +323,56 @@ class MCPFederationManager:
                 "resources/list",
                 {}
             )
-            if resources_response and "resources" in resources_response:
+        except Exception as e:
+            if isinstance(e, MCPMethodError) and e.code == _METHOD_NOT_FOUND:
+                # Resources are optional; a server without them simply has none
+                resources_response = {"resources": []}
+            else:
+                # Already logged and counted; keep the last known resources
+                resources_response = None
+
+        if resources_response and "resources" in resources_response:
+            if resources_response["resources"] != config.resources:
                 config.resources = resources_response["resources"]
-        except:
-            # Resources might not be supported
-            pass
+                config._namespaced_resources = _namespace_resources(config.name, config.resources)
+                config._router_view = None
+                changed = True
 
         config.is_healthy = True
-        config.last_health_check = datetime.now()
+        config.last_health_check = config.last_discovery = time.monotonic()
+        config.last_health_check_wall = time.time()
+
+        if changed:
+            self._bump_version()
+
+    async def _ping(self, config: MCPServerConfig) -> Optional[str]:
+        """
+        Lightweight liveness probe for an MCP server.
+
+        Sends a JSON-RPC ping; servers that don't implement ping but answer
+        with a JSON-RPC error are still considered alive.
+
+        Returns:
+            The server's ETag header if it reports one, else None
+
+        Raises:
+            Exception if the server is unreachable or returns an HTTP error
+        """
+        if not self._http_client:
+            raise RuntimeError("HTTP client not initialized")
+
+        try:
+            response = await self._http_client.post(
+                config.url,
+                content=_PING_REQUEST,
+                headers=config._headers
+            )
+            response.raise_for_status()
+        except Exception:
+            config.error_count += 1
+            raise
+
+        return response.headers.get("etag")
 
     async def _call_mcp_method(
         self,
@@ -163,44 +380,117 @@ class MCPFederationManager:
         method: str,
         params: Dict[str, Any]
     ) -> Optional[Dict]:
-        """Call an MCP method on a remote server."""
+        """
+        Call an MCP method on a remote server.
+
+        Calls to the same server made within a short window are coalesced
+        into a single JSON-RPC batch request. Results of read-only methods
+        are cached briefly; a tools/call drops that server's cached results.
+        """
         if not self._http_client:
             raise RuntimeError("HTTP client not initialized")
 
-        headers = {"Content-Type": "application/json"}
-
-        # Add authentication if configured
-        if config.auth_type == "bearer" and config.auth_token:
-            headers["Authorization"] = f"Bearer {config.auth_token}"
-        elif config.auth_type == "api_key" and config.auth_token:
-            headers["X-API-Key"] = config.auth_token
+        cache_key = None
+        if method in _CACHEABLE_METHODS:
+            cache_key = (config.name, method, orjson.dumps(params, option=orjson.OPT_SORT_KEYS))
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+        elif method == "tools/call":
+            # A tool call may change what the server lists or returns
+            self._invalidate_responses(config.name)
 
         request_data = {
             "jsonrpc": "2.0",
             "method": method,
             "params": params,
-            "id": 1
+            "id": next(self._request_ids)
         }
 
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        queue = self._batch_queues.setdefault(config.name, [])
+        queue.append((request_data, future))
+        if len(queue) == 1:
+            loop.call_later(self._batch_window, self._flush_batch, config)
+
         try:
-            response = await self._http_client.post(
-                config.url,
-                json=request_data,
-                headers=headers
-            )
-            response.raise_for_status()
+            result = await future
+
+        except MCPMethodError as e:
+            if e.code == _METHOD_NOT_FOUND:
+                # An optional capability the server lacks, not a failure
+                logger.debug("%s not supported by %s", method, config.name)
+            else:
+                logger.error("Error calling %s on %s: %s", method, config.name, e)
+                config.error_count += 1
+            raise
+        except Exception as e:
+            logger.error("Error calling %s on %s: %s", method, config.name, e)
+            config.error_count += 1
+            raise
+
+        if cache_key is not None and result is not None:
+            self._response_cache[cache_key] = result
 
-            data = response.json()
+        return result
 
-            if "error" in data:
-                raise Exception(f"MCP error: {data['error']}")
+    def _flush_batch(self, config: MCPServerConfig):
+        """Send all queued calls for a server."""
+        batch = self._batch_queues.pop(config.name, None)
+        if not batch:
+            return
 
-            return data.get("result")
+        task = asyncio.create_task(self._send_batch(config, batch))
+        self._batch_sends.add(task)
+        task.add_done_callback(self._batch_sends.discard)
 
+    async def _send_batch(self, config: MCPServerConfig, batch: List[Tuple[Dict, asyncio.Future]]):
+        """POST queued JSON-RPC calls, as one array when the server accepts batches."""
+        if len(batch) > 1 and config.supports_batch is not False:
+            try:
+                response = await self._http_client.post(
+                    config.url,
+                    content=orjson.dumps([request for request, _ in batch]),
+                    headers=config._headers
+                )
+            except Exception as e:
+                for _, future in batch:
+                    _fail(future, e)
+                return
+
+            replies = _batch_replies(response)
+            if replies is not None:
+                config.supports_batch = True
+                for request, future in batch:
+                    _resolve(future, replies.get(request["id"]), request["id"])
+                return
+
+            # Rejected with an HTTP error or answered with a single object: remember
+            # that and send these (and later) calls one at a time
+            config.supports_batch = False
+            logger.info("MCP server %s does not accept batches; sending calls individually", config.name)
+
+        await asyncio.gather(*[self._send_one(config, request, future) for request, future in batch])
+
+    async def _send_one(self, config: MCPServerConfig, request: Dict, future: asyncio.Future):
+        """POST a single JSON-RPC call and resolve its caller's future."""
+        try:
+            response = await self._http_client.post(
+                config.url,
+                content=orjson.dumps(request),
+                headers=config._headers
+            )
+            response.raise_for_status()
+            reply = orjson.loads(response.content)
+            if isinstance(reply, list):
+                reply = reply[0] if reply else None
         except Exception as e:
-            logger.error(f"Error calling {method} on {config.name}: {e}")
-            config.error_count += 1
-            raise
+            _fail(future, e)
+            return
+
+        _resolve(future, reply, request["id"])
 
     async def call_tool(
         self,
@@ -266,58 +556,57 @@ class MCPFederationManager:
             "original_name": "tool_name",
             "inputSchema": {...}
         }
+
+        The returned list is cached until capabilities change and must not
+        be modified by callers.
         """
-        all_tools = []
-
-        for server_name, config in self.servers.items():
-            if not config.enabled or not config.is_healthy:
-                continue
-
-            for tool in config.tools:
-                namespaced_tool = {
-                    "name": f"{server_name}.{tool['name']}",
-                    "description": f"[{server_name}] {tool.get('description', '')}",
-                    "server": server_name,
-                    "original_name": tool["name"],
-                    "inputSchema": tool.get("inputSchema", {})
-                }
-                all_tools.append(namespaced_tool)
+        if self._tools_cache and self._tools_cache[0] == self.version:
+            return self._tools_cache[1]
 
+        all_tools = list(itertools.chain.from_iterable(
+            config._namespaced_tools
+            for config in tuple(self.servers.values())
+            if config.enabled and config.is_healthy
+        ))
+
+        self._tools_cache = (self.version, all_tools)
         return all_tools
 
     def get_all_resources(self) -> List[Dict]:
-        """Get all resources from all registered servers with namespacing."""
-        all_resources = []
-
-        for server_name, config in self.servers.items():
-            if not config.enabled or not config.is_healthy:
-                continue
-
-            for resource in config.resources:
-                namespaced_resource = {
-                    "uri": f"{server_name}://{resource.get('uri', '')}",
-                    "name": f"[{server_name}] {resource.get('name', '')}",
-                    "server": server_name,
-                    "original_uri": resource.get("uri", ""),
-                    "mimeType": resource.get("mimeType", "application/json")
-                }
-                all_resources.append(namespaced_resource)
+        """Get all resources from all registered servers with namespacing (cached, read-only)."""
+        if self._resources_cache and self._resources_cache[0] == self.version:
+            return self._resources_cache[1]
+
+        all_resources = list(itertools.chain.from_iterable(
+            config._namespaced_resources
+            for config in tuple(self.servers.values())
+            if config.enabled and config.is_healthy
+        ))
 
+        self._resources_cache = (self.version, all_resources)
         return all_resources
 
     def get_server_info(self, name: str) -> Optional[Dict]:
         """Get information about a specific server."""
-        if name not in self.servers:
+        config = self.servers.get(name)
+        if config is None:
             return None
 
-        config = self.servers[name]
+        return self._server_info(config)
+
+    @staticmethod
+    def _server_info(config: MCPServerConfig) -> Dict:
+        """Summarize a server's configuration and state."""
         return {
             "name": config.name,
             "url": config.url,
             "description": config.description,
             "enabled": config.enabled,
             "is_healthy": config.is_healthy,
-            "last_health_check": config.last_health_check.isoformat() if config.last_health_check else None,
+            "last_health_check": (
+                datetime.fromtimestamp(config.last_health_check_wall).isoformat()
+                if config.last_health_check_wall else None
+            ),
             "tools_count": len(config.tools),
             "resources_count": len(config.resources),
             "error_count": config.error_count,
@@ -326,50 +615,103 @@ class MCPFederationManager:
 
     def list_servers(self) -> List[Dict]:
         """List all registered servers."""
-        return [self.get_server_info(name) for name in self.servers.keys()]
+        return [self._server_info(config) for config in tuple(self.servers.values())]
 
-    async def _health_monitor(self):
-        """Background task to monitor server health."""
-        while True:
-            try:
-                await asyncio.sleep(self._health_check_interval)
+    async def _check_one(self, name: str, config: MCPServerConfig) -> bool:
+        """Run a single server's health check and update its state."""
+        try:
+            # Ping first; only re-run full discovery when something may have changed
+            etag = await self._ping(config)
+
+            if (
+                not config.is_healthy
+                or etag != config.capabilities_version
+                or time.monotonic() - config.last_discovery >= self._discovery_interval
+            ):
+                await self._discover_server_capabilities(config)
+                config.capabilities_version = etag
+            else:
+                config.last_health_check = time.monotonic()
+                config.last_health_check_wall = time.time()
+
+            config.is_healthy = True
+            config.error_count = 0
+            config.backoff_seconds = self._health_check_interval
+            config.next_check_at = 0.0
+            logger.debug("Health check passed: %s", name)
+            return True
 
-                for name, config in self.servers.items():
-                    if not config.enabled:
-                        continue
+        except Exception as e:
+            if config.is_healthy:
+                self._bump_version()
+            config.is_healthy = False
+            # error_count was already bumped by the failing _ping or _call_mcp_method
+
+            # Back off exponentially instead of disabling, so transient outages recover
+            config.backoff_seconds = min(config.backoff_seconds * 2, self._max_backoff)
+            config.next_check_at = time.monotonic() + config.backoff_seconds
+            logger.warning(
+                "Health check failed for %s: %s (next check in %.0fs)",
+                name, e, config.backoff_seconds
+            )
 
-                    try:
-                        # Try to list tools as health check
-                        await self._discover_server_capabilities(config)
-                        config.is_healthy = True
-                        config.error_count = 0
-                        logger.debug(f"Health check passed: {name}")
+            return False
 
-                    except Exception as e:
-                        config.is_healthy = False
-                        config.error_count += 1
-                        logger.warning(f"Health check failed for {name}: {e}")
+    async def _health_monitor(self):
+        """Background task to monitor server health."""
+        interval = self._health_check_interval
+        next_tick = time.monotonic() + interval
 
-                        # Disable server after too many failures
-                        if config.error_count > 5:
-                            config.enabled = False
-                            logger.error(f"Disabled server {name} after repeated failures")
+        while True:
+            try:
+                # Sleep until a fixed deadline so check duration doesn't shift the cadence
+                await asyncio.sleep(max(0.0, next_tick - time.monotonic()))
+                next_tick += interval
+
+                # If we fell more than two intervals behind, skip the missed ticks
+                now = time.monotonic()
+                if now - next_tick > 2 * interval:
+                    next_tick = now + interval
+
+                # Check all servers concurrently so one slow server doesn't delay the rest;
+                # servers in backoff are skipped until their next check is due
+                snapshot = tuple(self.servers.items())
+                results = await asyncio.gather(
+                    *[
+                        self._check_one(name, config)
+                        for name, config in snapshot
+                        if config.enabled and config.next_check_at <= now
+                    ],
+                    return_exceptions=True
+                )
+
+                if results and logger.isEnabledFor(logging.DEBUG):
+                    healthy = sum(1 for r in results if r is True)
+                    logger.debug("Health checks complete: %s/%s healthy", healthy, len(results))
 
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                logger.error(f"Error in health monitor: {e}")
+                logger.error("Error in health monitor: %s", e)
 
     def get_stats(self) -> Dict:
         """Get federation statistics."""
-        healthy_servers = sum(1 for s in self.servers.values() if s.is_healthy)
-        total_tools = sum(len(s.tools) for s in self.servers.values() if s.is_healthy)
-        total_resources = sum(len(s.resources) for s in self.servers.values() if s.is_healthy)
+        servers = tuple(self.servers.values())
+        healthy_servers = total_tools = total_resources = 0
+        server_infos = []
+
+        # Single pass over the registry for both the totals and the per-server info
+        for config in servers:
+            if config.is_healthy:
+                healthy_servers += 1
+                total_tools += len(config.tools)
+                total_resources += len(config.resources)
+            server_infos.append(self._server_info(config))
 
         return {
-            "total_servers": len(self.servers),
+            "total_servers": len(servers),
             "healthy_servers": healthy_servers,
             "total_tools": total_tools,
             "total_resources": total_resources,
-            "servers": self.list_servers()
+            "servers": server_infos
         }
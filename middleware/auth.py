@@ -1,4 +1,5 @@
 """Authentication middleware for MCP Hub"""
+import hmac
 import os
 import secrets
 from fastapi import Request, HTTPException
@@ -12,13 +13,16 @@ class APIKeyMiddleware(BaseHTTPMiddleware):
         super().__init__(app)
         # Use provided API key or generate one from env
         self.api_key = api_key or os.getenv("MCP_API_KEY")
+        self._api_key_bytes = self.api_key.encode() if self.api_key else None
 
         # Public endpoints that don't require auth
-        self.public_paths = ["/health", "/", "/docs", "/openapi.json", "/redoc"]
+        self.public_paths = frozenset(("/health", "/", "/docs", "/openapi.json", "/redoc"))
+        self.public_prefixes = ("/docs/",)
 
     async def dispatch(self, request: Request, call_next: Callable):
         # Allow public endpoints
-        if request.url.path in self.public_paths:
+        path = request.url.path
+        if path in self.public_paths or path.startswith(self.public_prefixes):
             return await call_next(request)
 
         # Check for API key if configured
@@ -27,14 +31,23 @@ class APIKeyMiddleware(BaseHTTPMiddleware):
             auth_header = request.headers.get("Authorization")
             api_key_header = request.headers.get("X-API-Key")
 
-            valid = False
+            token = None
 
             # Support both Bearer token and X-API-Key header
             if auth_header and auth_header.startswith("Bearer "):
                 token = auth_header[7:]
-                valid = secrets.compare_digest(token, self.api_key)
             elif api_key_header:
-                valid = secrets.compare_digest(api_key_header, self.api_key)
+                token = api_key_header
+
+            valid = False
+            if token is not None:
+                # Headers are decoded as latin-1, so this recovers the raw bytes.
+                # compare_digest already leaks length mismatches, so checking first is free
+                token_bytes = token.encode("latin-1")
+                valid = (
+                    len(token_bytes) == len(self._api_key_bytes)
+                    and hmac.compare_digest(token_bytes, self._api_key_bytes)
+                )
 
             if not valid:
                 raise HTTPException(
@@ -1,20 +1,16 @@
 """MCP prompt templates"""
+from functools import lru_cache
 from mcp.types import PromptMessage, TextContent
 
-class PromptTemplates:
-    """Provides MCP prompt templates."""
-
-    @staticmethod
-    async def get(name: str, arguments: dict) -> PromptMessage:
-        """Get a prompt template."""
+_USER = "user"
+_TEXT = "text"
 
-        if name == "service-coordination":
-            task = arguments.get("task", "coordinate services")
-            return PromptMessage(
-                role="user",
-                content=TextContent(
-                    type="text",
-                    text=f"""Coordinate the following task across Northflank services:
+# name -> (argument name, default value, template text with one {argument} placeholder)
+_SOURCES = {
+    "service-coordination": (
+        "task",
+        "coordinate services",
+        """Coordinate the following task across Northflank services:
 
 Task: {task}
 
@@ -27,16 +23,11 @@ Available services:
 - MCP-Hub (this service)
 
 Plan the coordination steps and execute."""
-                )
-            )
-
-        elif name == "database-operation":
-            operation = arguments.get("operation", "query")
-            return PromptMessage(
-                role="user",
-                content=TextContent(
-                    type="text",
-                    text=f"""Perform the following database operation:
+    ),
+    "database-operation": (
+        "operation",
+        "query",
+        """Perform the following database operation:
 
 Operation: {operation}
 
@@ -45,16 +36,11 @@ Available databases:
 - Redis: Sessions, cache
 
 Guide me through the operation safely."""
-                )
-            )
-
-        elif name == "workflow-builder":
-            goal = arguments.get("goal", "build workflow")
-            return PromptMessage(
-                role="user",
-                content=TextContent(
-                    type="text",
-                    text=f"""Build a workflow to achieve:
+    ),
+    "workflow-builder": (
+        "goal",
+        "build workflow",
+        """Build a workflow to achieve:
 
 Goal: {goal}
 
@@ -65,10 +51,41 @@ Available tools:
 - Multi-step orchestration
 
 Design the workflow steps."""
-                )
-            )
+    ),
+}
+
+
+def _compile(arg: str, default: str, source: str) -> tuple:
+    """Split a template at its placeholder once, so rendering is two concatenations."""
+    prefix, suffix = source.split("{" + arg + "}")
+    return arg, default, prefix, suffix
+
+
+# name -> (argument name, default value, text before the value, text after it)
+_TEMPLATES = {name: _compile(*spec) for name, spec in _SOURCES.items()}
+
+
+def _make_msg(text: str) -> PromptMessage:
+    """Wrap prompt text in a user message."""
+    return PromptMessage(role=_USER, content=TextContent(type=_TEXT, text=text))
+
+
+@lru_cache(maxsize=256)
+def _render(name: str, value: str) -> PromptMessage:
+    """Build the prompt message for a template and argument value."""
+    template = _TEMPLATES.get(name)
+    if template is None:
+        return _make_msg(f"Unknown prompt: {name}")
+    return _make_msg(template[2] + value + template[3])
+
+
+class PromptTemplates:
+    """Provides MCP prompt templates."""
+
+    @staticmethod
+    async def get(name: str, arguments: dict) -> PromptMessage:
+        """Get a prompt template."""
+        template = _TEMPLATES.get(name)
+        value = str(arguments.get(template[0], template[1])) if template else ""
 
-        return PromptMessage(
-            role="user",
-            content=TextContent(type="text", text=f"Unknown prompt: {name}")
-        )
+        return _render(name, value)
@@ -5,16 +5,27 @@ FastAPI server that exposes MCP endpoints and agent team for service coordinatio
 """
 
 import os
+import asyncio
+import concurrent.futures
+import inspect
 import logging
+import threading
+import time
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, HTTPException
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel
-from typing import Optional
+from decimal import Decimal
+from fastapi import Depends, FastAPI, HTTPException, Request
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, ConfigDict
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+import orjson
 import uvicorn
+from cachetools import LRUCache, TTLCache
 
-from config.settings import PORT, ALLOWED_ORIGINS, SERVER_NAME, SERVER_VERSION
+from config.settings import (
+    PORT, ALLOWED_ORIGINS, SERVER_NAME, SERVER_VERSION, LOG_LEVEL,
+    OPENAI_API_KEY, ANTHROPIC_API_KEY, GROQ_API_KEY, MONGO_URI, REDIS_URI
+)
 from agents.mcp_coordinator import MCPCoordinatorAgent
 from agents.database_agent import DatabaseAgent
 from agents.service_agent import ServiceAgent
@@ -23,77 +34,180 @@ from agents.integration_agent import IntegrationAgent
 from agents.intelligent_router_agent import IntelligentRouterAgent
 from federation.mcp_federation_manager import MCPFederationManager
 from middleware.auth import APIKeyMiddleware
+from middleware.cors import ServiceCORSMiddleware
+from tools.service_tools import ServiceTools
+from tools.database_tools import DatabaseTools
+from tools.librechat_tools import LibreChatTools
+from tools.workflow_tools import WorkflowTools
+from tools.postgres_tools import PostgresTools
+from tools.minio_tools import MinIOTools
+from tools.rabbitmq_tools import RabbitMQTools
+from tools.generic_service_tools import GenericServiceTools
+from tools.service_discovery import get_discovery
+from tools.ms_agent_team_tools import MSAgentTeamTools
+from tools.http_client import create_http_client, set_http_client, close_http_clients
+from resources.northflank_resources import NorthflankResources
 
 # Configure logging
 logging.basicConfig(
-    level=logging.INFO,
+    level=LOG_LEVEL.upper(),
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
 
+
+def _orjson_default(obj: Any) -> Any:
+    """Encode the types jsonable_encoder accepts but orjson does not.
+
+    Responses returned directly (e.g. from /mcp) skip jsonable_encoder, so
+    sets, Decimals and bytes would otherwise fail to serialize.
+    """
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, bytes):
+        return obj.decode()
+    raise TypeError
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib encoder."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS)
+
+
 # Global agent team and federation
 agent_team = {}
 federation_manager: Optional[MCPFederationManager] = None
 router_agent: Optional[IntelligentRouterAgent] = None
 
+# Specialist agents expected in agent_team (the router is registered separately)
+_SPECIALISTS = ("mcp_coordinator", "database", "service", "workflow", "integration")
+_SPECIALIST_CLASSES = (MCPCoordinatorAgent, DatabaseAgent, ServiceAgent, WorkflowAgent, IntegrationAgent)
+
+# Agents whose run() is synchronous are called in a worker thread with this timeout
+_SYNC_AGENT_TIMEOUT = 60.0
+_sync_agents: frozenset = frozenset()
+
+# Async agents listed in AGENT_THREAD_OFFLOAD (comma-separated) do enough blocking or
+# CPU-bound work inside run() that they get their own event loop in a worker thread.
+# Opt-in only: an offloaded agent must not use loop-bound resources such as the shared
+# HTTP clients
+_offload_agents = frozenset(
+    name.strip() for name in os.getenv("AGENT_THREAD_OFFLOAD", "").split(",") if name.strip()
+)
+
+# Per-agent concurrency limits; callers beyond the limit wait, up to a bounded queue
+_AGENT_MAX_WAITING = int(os.getenv("AGENT_MAX_WAITING", "64"))
+_agent_semaphores: Dict[str, asyncio.Semaphore] = {}
+_agent_waiting: Dict[str, int] = {}
+
+# Settings are read from the environment once; derive the health flags from them up front
+_HAS_AI_KEY = bool(OPENAI_API_KEY or ANTHROPIC_API_KEY)
+_HAS_DBS = bool(MONGO_URI and REDIS_URI)
+
+# Serialized /health body; nothing in it changes after startup, so lifespan builds it once
+_health_body = orjson.dumps({"status": "healthy", "server": SERVER_NAME, "version": SERVER_VERSION})
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Startup and shutdown lifecycle."""
-    global agent_team, federation_manager, router_agent
+    global agent_team, federation_manager, router_agent, _health_body, _sync_agents, _discovery_task
 
     logger.info("🚀 Starting Northflank MCP Hub...")
 
-    # Initialize federation manager
-    try:
-        federation_manager = MCPFederationManager()
-        await federation_manager.start()
-        logger.info("✅ Federation manager initialized")
-    except Exception as e:
-        logger.error(f"❌ Error initializing federation manager: {e}")
+    # One pooled HTTP client for all tool calls, so keep-alive connections are reused
+    app.state.http = create_http_client()
+    set_http_client(app.state.http)
+
+    async def start_federation():
+        global federation_manager
+        try:
+            federation_manager = MCPFederationManager()
+            await federation_manager.start()
+            logger.info("✅ Federation manager initialized")
+        except Exception as e:
+            logger.error("❌ Error initializing federation manager: %s", e)
+
+    # Start federation, open database clients, warm service discovery and construct the
+    # agent team concurrently, so startup costs the slowest step rather than the sum
+    _, _, discovery_error, *instances = await asyncio.gather(
+        start_federation(),
+        DatabaseTools.connect(),
+        _refresh_dynamic_tools(),
+        *(asyncio.to_thread(cls) for cls in _SPECIALIST_CLASSES),
+        return_exceptions=True
+    )
+    if isinstance(discovery_error, Exception):
+        logger.error("❌ Error warming service discovery: %s", discovery_error)
+    _discovery_task = asyncio.create_task(_refresh_discovery_periodically())
 
-    # Initialize agent team
-    try:
-        agent_team["mcp_coordinator"] = MCPCoordinatorAgent()
-        agent_team["database"] = DatabaseAgent()
-        agent_team["service"] = ServiceAgent()
-        agent_team["workflow"] = WorkflowAgent()
-        agent_team["integration"] = IntegrationAgent()
+    for name, instance in zip(_SPECIALISTS, instances):
+        if isinstance(instance, Exception):
+            logger.error("❌ Error initializing %s agent: %s", name, instance)
+        else:
+            agent_team[name] = instance
+    if all(name in agent_team for name in _SPECIALISTS):
         logger.info("✅ Agent team initialized")
-    except Exception as e:
-        logger.error(f"❌ Error initializing agents: {e}")
 
     # Initialize intelligent router agent
     try:
         router_agent = IntelligentRouterAgent(federation_manager)
+        await router_agent.warmup()
         agent_team["router"] = router_agent
         logger.info("✅ Intelligent router agent initialized")
     except Exception as e:
-        logger.error(f"❌ Error initializing router agent: {e}")
+        logger.error("❌ Error initializing router agent: %s", e)
 
-    # Check for API keys
-    has_openai = os.getenv("OPENAI_API_KEY")
-    has_anthropic = os.getenv("ANTHROPIC_API_KEY")
-    has_groq = os.getenv("GROQ_API_KEY")
+    # Note agents with a blocking run() so consultations keep them off the event loop
+    _sync_agents = frozenset(
+        name for name, agent in agent_team.items()
+        if not inspect.iscoroutinefunction(agent.run)
+    )
 
-    if not has_openai and not has_anthropic:
+    for name in agent_team:
+        _agent_semaphores[name] = asyncio.Semaphore(
+            int(os.getenv(f"AGENT_{name.upper()}_CONCURRENCY", "16"))
+        )
+        _agent_waiting[name] = 0
+
+    # Check for API keys
+    if not _HAS_AI_KEY:
         logger.warning("⚠️  No OpenAI/Anthropic API keys found - agents will use fallback mode")
     else:
         logger.info("✅ AI API keys configured")
 
-    if has_groq:
+    if GROQ_API_KEY:
         logger.info("✅ Groq API key configured - intelligent routing enabled")
     else:
         logger.warning("⚠️  No Groq API key - using fallback routing")
 
-    logger.info(f"🎯 MCP Hub ready on port {PORT}")
+    _health_body = orjson.dumps({
+        "status": "healthy",
+        "server": SERVER_NAME,
+        "version": SERVER_VERSION,
+        "agents_ready": all(name in agent_team for name in _SPECIALISTS),
+        "api_keys_configured": _HAS_AI_KEY,
+        "databases_configured": _HAS_DBS
+    })
+
+    logger.info("🎯 MCP Hub ready on port %s", PORT)
 
     yield
 
     # Shutdown
     logger.info("Shutting down Northflank MCP Hub...")
+    if _discovery_task:
+        _discovery_task.cancel()
+    if router_agent:
+        await router_agent.close()
     if federation_manager:
         await federation_manager.stop()
+    await DatabaseTools.close()
+    await close_http_clients()
 
 
 # Create FastAPI app
@@ -101,12 +215,16 @@ app = FastAPI(
     title="Northflank MCP Hub",
     description="Universal MCP integration hub for Northflank services",
     version=SERVER_VERSION,
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
-# Add CORS middleware
+# Compress larger JSON bodies (tool and federation listings) for non-LAN clients
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+# Add CORS middleware (skipped for Origin-less service-to-service POSTs)
 app.add_middleware(
-    CORSMiddleware,
+    ServiceCORSMiddleware,
     allow_origins=ALLOWED_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
@@ -123,452 +241,672 @@ else:
 
 
 # Request/Response models
-class MCPRequest(BaseModel):
-    """MCP JSON-RPC 2.0 request."""
-    jsonrpc: str = "2.0"
-    method: str
-    params: Optional[dict] = None
-    id: Optional[int] = None
+# JSON-RPC request ids; /mcp bodies are parsed with orjson rather than a model
+RequestId = Union[int, str, None]
+_ID_TYPES = (int, str, type(None))
 
 
 class ConsultRequest(BaseModel):
     """Agent consultation request."""
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     question: str
     specialist: Optional[str] = None
 
 
 # Root endpoint
+# Static response bodies, serialized once at import
+_ROOT_BODY = orjson.dumps({
+    "name": SERVER_NAME,
+    "version": SERVER_VERSION,
+    "description": "Universal MCP integration hub for Northflank",
+    "endpoints": {
+        "/": "Hub information",
+        "/health": "Health check",
+        "/mcp": "MCP JSON-RPC endpoint (POST)",
+        "/agents": "List agent specialists",
+        "/agents/consult": "Consult agent team (POST)",
+        "/docs": "Interactive API docs"
+    },
+    "capabilities": {
+        "tools": "20+ (with auto-discovery)",
+        "resources": 4,
+        "prompts": 3,
+        "agents": 5,
+        "auto_discovery": True
+    },
+    "services": [
+        "LibreChat", "MongoDB", "Redis", "PostgreSQL", "MinIO", "RabbitMQ",
+        "MS-Agent-Team", "Voice-Agent-Revolt", "Mattermost", "Token-Server",
+        "...and auto-discovered services"
+    ]
+})
+
+
 @app.get("/")
 async def root():
     """Root endpoint with hub information."""
-    return {
-        "name": SERVER_NAME,
-        "version": SERVER_VERSION,
-        "description": "Universal MCP integration hub for Northflank",
-        "endpoints": {
-            "/": "Hub information",
-            "/health": "Health check",
-            "/mcp": "MCP JSON-RPC endpoint (POST)",
-            "/agents": "List agent specialists",
-            "/agents/consult": "Consult agent team (POST)",
-            "/docs": "Interactive API docs"
-        },
-        "capabilities": {
-            "tools": "20+ (with auto-discovery)",
-            "resources": 4,
-            "prompts": 3,
-            "agents": 5,
-            "auto_discovery": True
-        },
-        "services": [
-            "LibreChat", "MongoDB", "Redis", "PostgreSQL", "MinIO", "RabbitMQ",
-            "MS-Agent-Team", "Voice-Agent-Revolt", "Mattermost", "Token-Server",
-            "...and auto-discovered services"
-        ]
-    }
+    return Response(_ROOT_BODY, media_type="application/json")
 
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
+    return Response(_health_body, media_type="application/json")
+
+
+# Static MCP payloads, built once at import and shared read-only between requests
+_INITIALIZE_RESULT = {
+    "protocolVersion": "2024-11-05",
+    "capabilities": {
+        "tools": {"listChanged": True},
+        "resources": {"subscribe": False, "listChanged": False},
+        "prompts": {"listChanged": False}
+    },
+    "serverInfo": {
+        "name": SERVER_NAME,
+        "version": SERVER_VERSION
+    }
+}
+
+_RESOURCES_LIST_RESULT = {
+    "resources": [
+        {
+            "uri": "northflank://project/info",
+            "name": "Project Info",
+            "mimeType": "application/json"
+        },
+        {
+            "uri": "northflank://services/list",
+            "name": "Services List",
+            "mimeType": "application/json"
+        }
+    ]
+}
+
+# Built-in tools advertised by tools/list, frozen at import (discovered service tools
+# are appended when the encoded body is rebuilt)
+_STATIC_TOOLS = (
+    # MS Agent Team interaction
+    {
+        "name": "agent_team_chat",
+        "description": "Chat with the MS Agent Team - send messages and get AI agent responses",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "message": {"type": "string", "description": "Your message or question for the agent team"},
+                "context": {"type": "object", "description": "Optional context information", "default": {}}
+            },
+            "required": ["message"]
+        }
+    },
+    {
+        "name": "agent_team_status",
+        "description": "Get the health/status of the MS Agent Team service",
+        "inputSchema": {"type": "object"}
+    },
+    {
+        "name": "agent_team_list_agents",
+        "description": "List all available AI agents in the team",
+        "inputSchema": {"type": "object"}
+    },
+    {
+        "name": "agent_team_query",
+        "description": "Query a specific AI agent by name",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "agent_name": {"type": "string", "description": "Name of the agent to query"},
+                "query": {"type": "string", "description": "Your question or query for the agent"}
+            },
+            "required": ["agent_name", "query"]
+        }
+    },
+    # Service Coordination
+    {
+        "name": "coordinate_services",
+        "description": "Coordinate operations between multiple services",
+        "inputSchema": {"type": "object", "properties": {"operation": {"type": "string"}}}
+    },
+    {
+        "name": "health_check_all",
+        "description": "Check health of all services",
+        "inputSchema": {"type": "object"}
+    },
+    {
+        "name": "discover_services",
+        "description": "Discover all available services and addons in the project",
+        "inputSchema": {"type": "object"}
+    },
+    {
+        "name": "call_service",
+        "description": "Call any service by name with custom endpoint",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "service_name": {"type": "string", "description": "Service name"},
+                "endpoint": {"type": "string", "description": "API endpoint", "default": "/"},
+                "method": {"type": "string", "enum": ["GET", "POST", "PUT", "DELETE"], "default": "GET"},
+                "data": {"type": "object", "description": "Request body"}
+            },
+            "required": ["service_name"]
+        }
+    },
+    # MongoDB
+    {
+        "name": "mongo_query",
+        "description": "Execute MongoDB query",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "collection": {"type": "string"},
+                "operation": {"type": "string"}
+            },
+            "required": ["collection", "operation"]
+        }
+    },
+    # Redis
+    {
+        "name": "redis_get",
+        "description": "Get value from Redis",
+        "inputSchema": {
+            "type": "object",
+            "properties": {"key": {"type": "string"}},
+            "required": ["key"]
+        }
+    },
+    {
+        "name": "redis_set",
+        "description": "Set value in Redis",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "key": {"type": "string"},
+                "value": {"type": "string"}
+            },
+            "required": ["key", "value"]
+        }
+    },
+    {
+        "name": "redis_mget",
+        "description": "Get several values from Redis in one round trip",
+        "inputSchema": {
+            "type": "object",
+            "properties": {"keys": {"type": "array", "items": {"type": "string"}}},
+            "required": ["keys"]
+        }
+    },
+    {
+        "name": "redis_mset",
+        "description": "Set several values in Redis in one pipelined round trip",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "items": {"type": "object", "additionalProperties": {"type": "string"}},
+                "ttl": {"type": "integer"}
+            },
+            "required": ["items"]
+        }
+    },
+    # PostgreSQL
+    {
+        "name": "postgres_query",
+        "description": "Execute PostgreSQL query",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "query": {"type": "string"},
+                "params": {"type": "array"}
+            },
+            "required": ["query"]
+        }
+    },
+    {
+        "name": "postgres_vector_search",
+        "description": "Perform pgvector similarity search",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "table": {"type": "string"},
+                "vector": {"type": "array"},
+                "limit": {"type": "integer", "default": 10}
+            },
+            "required": ["table", "vector"]
+        }
+    },
+    # MinIO
+    {
+        "name": "minio_list_buckets",
+        "description": "List all MinIO buckets",
+        "inputSchema": {"type": "object"}
+    },
+    {
+        "name": "minio_list_objects",
+        "description": "List objects in a MinIO bucket",
+        "inputSchema": {
+            "type": "object",
+            "properties": {"bucket": {"type": "string"}},
+            "required": ["bucket"]
+        }
+    },
+    # RabbitMQ
+    {
+        "name": "rabbitmq_publish",
+        "description": "Publish message to RabbitMQ queue",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "queue": {"type": "string"},
+                "message": {"type": "object"}
+            },
+            "required": ["queue", "message"]
+        }
+    },
+    {
+        "name": "rabbitmq_consume",
+        "description": "Consume messages from RabbitMQ queue",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "queue": {"type": "string"},
+                "count": {"type": "integer", "default": 1}
+            },
+            "required": ["queue"]
+        }
+    },
+    # LibreChat
+    {
+        "name": "librechat_send_message",
+        "description": "Send message to LibreChat",
+        "inputSchema": {
+            "type": "object",
+            "properties": {"message": {"type": "string"}},
+            "required": ["message"]
+        }
+    },
+    # Workflows
+    {
+        "name": "create_workflow",
+        "description": "Create multi-step workflow",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "name": {"type": "string"},
+                "steps": {"type": "array"}
+            },
+            "required": ["name", "steps"]
+        }
+    }
+)
+
+
+async def _handle_initialize(req_id: RequestId, params: Dict) -> Dict:
+    """Handle the MCP initialize handshake."""
+    return {"jsonrpc": "2.0", "id": req_id, "result": _INITIALIZE_RESULT}
+
+
+# Dynamically discovered service tools, warmed at startup and refreshed in the background
+# so tools/list never waits on discovery (which shells out to the northflank CLI)
+_DISCOVERY_REFRESH_INTERVAL = 300.0
+_dynamic_tools: list = []
+_discovery_task: Optional[asyncio.Task] = None
+
+# Encoded tools/list result, rebuilt whenever the dynamic tools change
+_tools_list_body = orjson.dumps({"tools": _STATIC_TOOLS})
+
+
+async def _refresh_dynamic_tools():
+    """
+    Re-run service discovery and regenerate the dynamic tool list.
+
+    Raises if discovery fails, leaving the last good tools and discovery cache in place.
+    """
+    global _dynamic_tools, _tools_list_body
+    discovery = get_discovery()
+    tools = discovery.build_service_tools(await discovery.refresh_services())
+    _dynamic_tools = tools
+    _tools_list_body = orjson.dumps({"tools": (*_STATIC_TOOLS, *tools)})
+
+    # Addons don't feed tools/list, so a failure there only keeps the old addon list
+    try:
+        await discovery.refresh_addons()
+    except Exception as e:
+        logger.warning("Addon discovery refresh failed: %s", e)
+
+
+async def _refresh_discovery_periodically():
+    """Background task keeping the dynamic tool list current."""
+    while True:
+        await asyncio.sleep(_DISCOVERY_REFRESH_INTERVAL)
+        try:
+            await _refresh_dynamic_tools()
+        except Exception as e:
+            logger.error("Discovery refresh failed: %s", e)
+
+
+async def _handle_tools_list(req_id: RequestId, params: Dict) -> Response:
+    """List built-in tools followed by the dynamically discovered service tools."""
+    return _result_response(req_id, _tools_list_body)
+
+
+async def _discover_services(tool_name: str, tool_args: Dict) -> str:
+    """Run service discovery and summarize the result."""
+    discovery = get_discovery()
+    discovery_result = await discovery.discover_all()
+    return f"Discovered {discovery_result['total_services']} services and {discovery_result['total_addons']} addons"
+
+
+# Tool name -> handler coroutine taking (tool_name, tool_args)
+_TOOL_ROUTER = {
+    # MS Agent Team interaction
+    "agent_team_chat": MSAgentTeamTools.handle,
+    "agent_team_status": MSAgentTeamTools.handle,
+    "agent_team_list_agents": MSAgentTeamTools.handle,
+    "agent_team_query": MSAgentTeamTools.handle,
+    # Service coordination and discovery
+    "coordinate_services": ServiceTools.handle,
+    "health_check_all": ServiceTools.handle,
+    "list_northflank_services": ServiceTools.handle,
+    "get_service_info": ServiceTools.handle,
+    "discover_services": _discover_services,
+    "call_service": GenericServiceTools.handle,
+    # MongoDB & Redis
+    "mongo_query": DatabaseTools.handle,
+    "redis_get": DatabaseTools.handle,
+    "redis_set": DatabaseTools.handle,
+    "redis_mget": DatabaseTools.handle,
+    "redis_mset": DatabaseTools.handle,
+    # PostgreSQL
+    "postgres_query": PostgresTools.handle,
+    "postgres_execute": PostgresTools.handle,
+    "postgres_vector_search": PostgresTools.handle,
+    # MinIO
+    "minio_list_buckets": MinIOTools.handle,
+    "minio_list_objects": MinIOTools.handle,
+    "minio_get_object": MinIOTools.handle,
+    "minio_put_object": MinIOTools.handle,
+    # RabbitMQ
+    "rabbitmq_publish": RabbitMQTools.handle,
+    "rabbitmq_consume": RabbitMQTools.handle,
+    "rabbitmq_queue_info": RabbitMQTools.handle,
+    "rabbitmq_declare_queue": RabbitMQTools.handle,
+    # LibreChat
+    "librechat_send_message": LibreChatTools.handle,
+    "librechat_get_config": LibreChatTools.handle,
+    # Workflows
+    "create_workflow": WorkflowTools.handle,
+    "execute_workflow": WorkflowTools.handle,
+}
+
+
+# Tool output above this many characters is streamed in chunks rather than encoded in one piece
+_STREAM_THRESHOLD = 1 << 20
+_STREAM_CHUNK = 64 * 1024
+
+
+def _stream_tool_result(req_id: RequestId, text: str) -> StreamingResponse:
+    """Stream a tools/call envelope, JSON-escaping the text one slice at a time."""
+    def body():
+        yield b'{"jsonrpc":"2.0","id":' + orjson.dumps(req_id) + b',"result":{"content":[{"type":"text","text":"'
+        for start in range(0, len(text), _STREAM_CHUNK):
+            # Strip the surrounding quotes orjson adds to each slice
+            yield orjson.dumps(text[start:start + _STREAM_CHUNK])[1:-1]
+        yield b'"}]}}'
+
+    return StreamingResponse(body(), media_type="application/json")
+
+
+async def _handle_tools_call(req_id: RequestId, params: Dict) -> Union[Dict, StreamingResponse]:
+    """Execute a tool."""
+    tool_name = params.get("name")
+    tool_args = params.get("arguments", {})
+
+    logger.info("Calling tool: %s", tool_name)
+
+    # Route to appropriate tool handler; generic service calls (including
+    # dynamically discovered services) are matched by prefix
+    handler = _TOOL_ROUTER.get(tool_name)
+    if handler is None and tool_name.startswith("call_"):
+        handler = GenericServiceTools.handle
+
+    if handler:
+        result = await handler(tool_name, tool_args)
+    else:
+        result = f"Unknown tool: {tool_name}"
+
+    # Handlers return str; structured results are encoded as JSON rather than repr'd
+    if not isinstance(result, str):
+        result = orjson.dumps(result, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    if len(result) > _STREAM_THRESHOLD:
+        return _stream_tool_result(req_id, result)
+
     return {
-        "status": "healthy",
-        "server": SERVER_NAME,
-        "version": SERVER_VERSION,
-        "agents_ready": len(agent_team) == 5,
-        "api_keys_configured": bool(
-            os.getenv("OPENAI_API_KEY") or os.getenv("ANTHROPIC_API_KEY")
-        ),
-        "databases_configured": bool(
-            os.getenv("MONGO_URI") and os.getenv("REDIS_URI")
-        )
+        "jsonrpc": "2.0",
+        "id": req_id,
+        "result": {
+            "content": [{"type": "text", "text": result}]
+        }
     }
 
 
-@app.post("/mcp")
-async def mcp_endpoint(request: MCPRequest):
+async def _handle_resources_list(req_id: RequestId, params: Dict) -> Dict:
+    """List built-in resources."""
+    return {"jsonrpc": "2.0", "id": req_id, "result": _RESOURCES_LIST_RESULT}
+
+
+async def _handle_resources_read(req_id: RequestId, params: Dict) -> Dict:
+    """Read a built-in resource."""
+    uri = params.get("uri")
+    content = await NorthflankResources.read(uri)
+
+    return {
+        "jsonrpc": "2.0",
+        "id": req_id,
+        "result": {
+            "contents": [{"uri": uri, "mimeType": "application/json", "text": content}]
+        }
+    }
+
+
+# MCP method -> handler
+_MCP_HANDLERS = {
+    "initialize": _handle_initialize,
+    "tools/list": _handle_tools_list,
+    "tools/call": _handle_tools_call,
+    "resources/list": _handle_resources_list,
+    "resources/read": _handle_resources_read,
+}
+
+# Methods whose result ignores params, encoded once at import. initialize params carry
+# per-client info, so keying these by params would only churn the cache below
+_STATIC_RESULT_BODIES = {
+    "initialize": orjson.dumps(_INITIALIZE_RESULT),
+    "resources/list": orjson.dumps(_RESOURCES_LIST_RESULT),
+}
+
+# Deterministic methods whose results are cached by (method, params). tools/list is
+# excluded because it includes discovered services, and tools/call has side effects.
+# Values are the orjson-encoded result, spliced into the envelope on a hit.
+_CACHEABLE_METHODS = frozenset(("resources/read",))
+_RESPONSE_CACHE: LRUCache = LRUCache(maxsize=1024)
+
+
+def _result_response(req_id: RequestId, result_body: bytes) -> Response:
+    """Wrap a pre-encoded result in a JSON-RPC envelope without re-encoding it."""
+    return Response(
+        b'{"jsonrpc":"2.0","id":' + orjson.dumps(req_id) + b',"result":' + result_body + b"}",
+        media_type="application/json"
+    )
+
+
+# Largest JSON-RPC batch accepted on /mcp; bigger batches amplify tail latency
+_MAX_BATCH_SIZE = 100
+
+
+def _error_response(req_id: RequestId, code: int, message: str) -> ORJSONResponse:
+    """Build a JSON-RPC error response."""
+    return ORJSONResponse({
+        "jsonrpc": "2.0",
+        "id": req_id,
+        "error": {"code": code, "message": message}
+    })
+
+
+async def _dispatch(payload: Any) -> Response:
+    """Handle one decoded JSON-RPC request; errors are returned as JSON-RPC error responses."""
+    if not isinstance(payload, dict):
+        return _error_response(None, -32600, "Invalid Request")
+
+    method = payload.get("method")
+    params = payload.get("params") or {}
+    req_id = payload.get("id")
+    if type(req_id) not in _ID_TYPES:
+        return _error_response(None, -32600, "Invalid Request: id must be a string, integer or null")
+    if not isinstance(method, str) or not isinstance(params, dict):
+        return _error_response(req_id, -32600, "Invalid Request: method must be a string and params an object")
+
+    logger.info("MCP request: %s", method)
+
+    handler = _MCP_HANDLERS.get(method)
+    if handler is None:
+        return _error_response(req_id, -32601, f"Unknown MCP method: {method}")
+
+    try:
+        result_body = _STATIC_RESULT_BODIES.get(method)
+        if result_body is not None:
+            return _result_response(req_id, result_body)
+
+        cache_key = None
+        if method in _CACHEABLE_METHODS:
+            cache_key = (method, orjson.dumps(params, option=orjson.OPT_SORT_KEYS))
+            result_body = _RESPONSE_CACHE.get(cache_key)
+            if result_body is not None:
+                return _result_response(req_id, result_body)
+
+        response = await handler(req_id, params)
+        if isinstance(response, Response):
+            return response
+
+        if cache_key is not None and "result" in response:
+            _RESPONSE_CACHE[cache_key] = orjson.dumps(response["result"], option=orjson.OPT_NON_STR_KEYS)
+
+        return ORJSONResponse(response)
+
+    except Exception as e:
+        logger.error("MCP error: %s", e)
+        return _error_response(req_id, -32603, str(e))
+
+
+async def _response_bytes(response: Response) -> bytes:
+    """Return a dispatched response's body, draining it if it was streamed."""
+    if isinstance(response, StreamingResponse):
+        return b"".join([chunk async for chunk in response.body_iterator])
+    return response.body
+
+
+@app.post("/mcp", response_class=ORJSONResponse, response_model=None)
+async def mcp_endpoint(request: Request) -> Response:
     """
     MCP JSON-RPC 2.0 endpoint.
 
     Handles MCP protocol requests for tools, resources, and prompts.
+    A JSON-RPC batch (array of requests) is dispatched concurrently and
+    answered with an array of responses in the same order.
+    The body is decoded with orjson and checked by hand rather than through
+    a Pydantic model, and responses are returned as Response objects so
+    FastAPI skips jsonable_encoder; cached results are spliced in as
+    pre-encoded bytes.
     """
-    logger.info(f"MCP request: {request.method}")
-
     try:
-        # Handle different MCP methods
-        if request.method == "initialize":
-            return {
-                "jsonrpc": "2.0",
-                "id": request.id,
-                "result": {
-                    "protocolVersion": "2024-11-05",
-                    "capabilities": {
-                        "tools": {"listChanged": True},
-                        "resources": {"subscribe": False, "listChanged": False},
-                        "prompts": {"listChanged": False}
-                    },
-                    "serverInfo": {
-                        "name": SERVER_NAME,
-                        "version": SERVER_VERSION
-                    }
-                }
-            }
-
-        elif request.method == "tools/list":
-            # Import tool list from MCP server
-            from tools.service_tools import ServiceTools
-            from tools.database_tools import DatabaseTools
-            from tools.librechat_tools import LibreChatTools
-            from tools.workflow_tools import WorkflowTools
-            from tools.service_discovery import get_discovery
-            from tools.ms_agent_team_tools import MSAgentTeamTools
-
-            # Get dynamically discovered services
-            discovery = get_discovery()
-            dynamic_tools = await discovery.generate_service_tools()
-
-            tools = [
-                # MS Agent Team interaction
-                {
-                    "name": "agent_team_chat",
-                    "description": "Chat with the MS Agent Team - send messages and get AI agent responses",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "message": {"type": "string", "description": "Your message or question for the agent team"},
-                            "context": {"type": "object", "description": "Optional context information", "default": {}}
-                        },
-                        "required": ["message"]
-                    }
-                },
-                {
-                    "name": "agent_team_status",
-                    "description": "Get the health/status of the MS Agent Team service",
-                    "inputSchema": {"type": "object"}
-                },
-                {
-                    "name": "agent_team_list_agents",
-                    "description": "List all available AI agents in the team",
-                    "inputSchema": {"type": "object"}
-                },
-                {
-                    "name": "agent_team_query",
-                    "description": "Query a specific AI agent by name",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "agent_name": {"type": "string", "description": "Name of the agent to query"},
-                            "query": {"type": "string", "description": "Your question or query for the agent"}
-                        },
-                        "required": ["agent_name", "query"]
-                    }
-                },
-                # Service Coordination
-                {
-                    "name": "coordinate_services",
-                    "description": "Coordinate operations between multiple services",
-                    "inputSchema": {"type": "object", "properties": {"operation": {"type": "string"}}}
-                },
-                {
-                    "name": "health_check_all",
-                    "description": "Check health of all services",
-                    "inputSchema": {"type": "object"}
-                },
-                {
-                    "name": "discover_services",
-                    "description": "Discover all available services and addons in the project",
-                    "inputSchema": {"type": "object"}
-                },
-                {
-                    "name": "call_service",
-                    "description": "Call any service by name with custom endpoint",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "service_name": {"type": "string", "description": "Service name"},
-                            "endpoint": {"type": "string", "description": "API endpoint", "default": "/"},
-                            "method": {"type": "string", "enum": ["GET", "POST", "PUT", "DELETE"], "default": "GET"},
-                            "data": {"type": "object", "description": "Request body"}
-                        },
-                        "required": ["service_name"]
-                    }
-                },
-                # MongoDB
-                {
-                    "name": "mongo_query",
-                    "description": "Execute MongoDB query",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "collection": {"type": "string"},
-                            "operation": {"type": "string"}
-                        },
-                        "required": ["collection", "operation"]
-                    }
-                },
-                # Redis
-                {
-                    "name": "redis_get",
-                    "description": "Get value from Redis",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {"key": {"type": "string"}},
-                        "required": ["key"]
-                    }
-                },
-                {
-                    "name": "redis_set",
-                    "description": "Set value in Redis",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "key": {"type": "string"},
-                            "value": {"type": "string"}
-                        },
-                        "required": ["key", "value"]
-                    }
-                },
-                # PostgreSQL
-                {
-                    "name": "postgres_query",
-                    "description": "Execute PostgreSQL query",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "query": {"type": "string"},
-                            "params": {"type": "array"}
-                        },
-                        "required": ["query"]
-                    }
-                },
-                {
-                    "name": "postgres_vector_search",
-                    "description": "Perform pgvector similarity search",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "table": {"type": "string"},
-                            "vector": {"type": "array"},
-                            "limit": {"type": "integer", "default": 10}
-                        },
-                        "required": ["table", "vector"]
-                    }
-                },
-                # MinIO
-                {
-                    "name": "minio_list_buckets",
-                    "description": "List all MinIO buckets",
-                    "inputSchema": {"type": "object"}
-                },
-                {
-                    "name": "minio_list_objects",
-                    "description": "List objects in a MinIO bucket",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {"bucket": {"type": "string"}},
-                        "required": ["bucket"]
-                    }
-                },
-                # RabbitMQ
-                {
-                    "name": "rabbitmq_publish",
-                    "description": "Publish message to RabbitMQ queue",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "queue": {"type": "string"},
-                            "message": {"type": "object"}
-                        },
-                        "required": ["queue", "message"]
-                    }
-                },
-                {
-                    "name": "rabbitmq_consume",
-                    "description": "Consume messages from RabbitMQ queue",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "queue": {"type": "string"},
-                            "count": {"type": "integer", "default": 1}
-                        },
-                        "required": ["queue"]
-                    }
-                },
-                # LibreChat
-                {
-                    "name": "librechat_send_message",
-                    "description": "Send message to LibreChat",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {"message": {"type": "string"}},
-                        "required": ["message"]
-                    }
-                },
-                # Workflows
-                {
-                    "name": "create_workflow",
-                    "description": "Create multi-step workflow",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "name": {"type": "string"},
-                            "steps": {"type": "array"}
-                        },
-                        "required": ["name", "steps"]
-                    }
-                }
-            ]
-
-            # Add dynamically discovered service tools
-            tools.extend(dynamic_tools)
-
-            return {
-                "jsonrpc": "2.0",
-                "id": request.id,
-                "result": {"tools": tools}
-            }
-
-        elif request.method == "tools/call":
-            # Execute tool
-            tool_name = request.params.get("name")
-            tool_args = request.params.get("arguments", {})
-
-            logger.info(f"Calling tool: {tool_name}")
-
-            # Route to appropriate tool handler
-            from tools.service_tools import ServiceTools
-            from tools.database_tools import DatabaseTools
-            from tools.librechat_tools import LibreChatTools
-            from tools.workflow_tools import WorkflowTools
-            from tools.postgres_tools import PostgresTools
-            from tools.minio_tools import MinIOTools
-            from tools.rabbitmq_tools import RabbitMQTools
-            from tools.generic_service_tools import GenericServiceTools
-            from tools.service_discovery import get_discovery
-            from tools.ms_agent_team_tools import MSAgentTeamTools
-
-            # MS Agent Team interaction
-            if tool_name in ["agent_team_chat", "agent_team_status", "agent_team_list_agents", "agent_team_query"]:
-                result = await MSAgentTeamTools.handle(tool_name, tool_args)
-            # Service coordination and discovery
-            elif tool_name in ["coordinate_services", "health_check_all", "list_northflank_services", "get_service_info"]:
-                result = await ServiceTools.handle(tool_name, tool_args)
-            elif tool_name == "discover_services":
-                discovery = get_discovery()
-                discovery_result = await discovery.discover_all()
-                result = f"Discovered {discovery_result['total_services']} services and {discovery_result['total_addons']} addons"
-            # MongoDB & Redis
-            elif tool_name in ["mongo_query", "redis_get", "redis_set"]:
-                result = await DatabaseTools.handle(tool_name, tool_args)
-            # PostgreSQL
-            elif tool_name in ["postgres_query", "postgres_execute", "postgres_vector_search"]:
-                result = await PostgresTools.handle(tool_name, tool_args)
-            # MinIO
-            elif tool_name in ["minio_list_buckets", "minio_list_objects", "minio_get_object", "minio_put_object"]:
-                result = await MinIOTools.handle(tool_name, tool_args)
-            # RabbitMQ
-            elif tool_name in ["rabbitmq_publish", "rabbitmq_consume", "rabbitmq_queue_info", "rabbitmq_declare_queue"]:
-                result = await RabbitMQTools.handle(tool_name, tool_args)
-            # LibreChat
-            elif tool_name in ["librechat_send_message", "librechat_get_config"]:
-                result = await LibreChatTools.handle(tool_name, tool_args)
-            # Workflows
-            elif tool_name in ["create_workflow", "execute_workflow"]:
-                result = await WorkflowTools.handle(tool_name, tool_args)
-            # Generic service calls (including dynamically discovered services)
-            elif tool_name == "call_service" or tool_name.startswith("call_"):
-                result = await GenericServiceTools.handle(tool_name, tool_args)
-            else:
-                result = f"Unknown tool: {tool_name}"
-
-            return {
-                "jsonrpc": "2.0",
-                "id": request.id,
-                "result": {
-                    "content": [{"type": "text", "text": str(result)}]
-                }
-            }
-
-        elif request.method == "resources/list":
-            return {
-                "jsonrpc": "2.0",
-                "id": request.id,
-                "result": {
-                    "resources": [
-                        {
-                            "uri": "northflank://project/info",
-                            "name": "Project Info",
-                            "mimeType": "application/json"
-                        },
-                        {
-                            "uri": "northflank://services/list",
-                            "name": "Services List",
-                            "mimeType": "application/json"
-                        }
-                    ]
-                }
-            }
-
-        elif request.method == "resources/read":
-            uri = request.params.get("uri")
-            from resources.northflank_resources import NorthflankResources
-            content = await NorthflankResources.read(uri)
-
-            return {
-                "jsonrpc": "2.0",
-                "id": request.id,
-                "result": {
-                    "contents": [{"uri": uri, "mimeType": "application/json", "text": content}]
-                }
-            }
+        payload = orjson.loads(await request.body())
+    except orjson.JSONDecodeError:
+        return _error_response(None, -32700, "Parse error")
 
-        else:
-            raise HTTPException(status_code=400, detail=f"Unknown MCP method: {request.method}")
+    if not isinstance(payload, list):
+        return await _dispatch(payload)
 
-    except Exception as e:
-        logger.error(f"MCP error: {e}")
-        return {
-            "jsonrpc": "2.0",
-            "id": request.id,
-            "error": {
-                "code": -32603,
-                "message": str(e)
-            }
+    if not payload or len(payload) > _MAX_BATCH_SIZE:
+        return _error_response(None, -32600, f"Batch must contain 1 to {_MAX_BATCH_SIZE} requests")
+
+    responses = await asyncio.gather(*(_dispatch(item) for item in payload))
+    bodies = [await _response_bytes(response) for response in responses]
+    return Response(b"[" + b",".join(bodies) + b"]", media_type="application/json")
+
+
+_AGENTS_BODY = orjson.dumps({
+    "agents": [
+        {
+            "name": "mcp_coordinator",
+            "title": "MCP Coordinator",
+            "description": "Primary orchestrator for MCP operations"
+        },
+        {
+            "name": "database",
+            "title": "Database Agent",
+            "description": "MongoDB and Redis specialist"
+        },
+        {
+            "name": "service",
+            "title": "Service Agent",
+            "description": "Service integration and coordination"
+        },
+        {
+            "name": "workflow",
+            "title": "Workflow Agent",
+            "description": "Multi-step process orchestration"
+        },
+        {
+            "name": "integration",
+            "title": "Integration Agent",
+            "description": "External API and service connections"
         }
+    ]
+})
 
 
 @app.get("/agents")
 async def list_agents():
     """List all agent specialists."""
-    return {
-        "agents": [
-            {
-                "name": "mcp_coordinator",
-                "title": "MCP Coordinator",
-                "description": "Primary orchestrator for MCP operations"
-            },
-            {
-                "name": "database",
-                "title": "Database Agent",
-                "description": "MongoDB and Redis specialist"
-            },
-            {
-                "name": "service",
-                "title": "Service Agent",
-                "description": "Service integration and coordination"
-            },
-            {
-                "name": "workflow",
-                "title": "Workflow Agent",
-                "description": "Multi-step process orchestration"
-            },
-            {
-                "name": "integration",
-                "title": "Integration Agent",
-                "description": "External API and service connections"
-            }
-        ]
-    }
+    return Response(_AGENTS_BODY, media_type="application/json")
+
+
+def _run_on_own_loop(
+    agent: Any,
+    question: str,
+    handle: concurrent.futures.Future,
+    stop: threading.Event
+) -> Any:
+    """Worker-thread body: run an agent on a private event loop, exposing it for cancellation."""
+    async def main():
+        handle.set_result((asyncio.get_running_loop(), asyncio.current_task()))
+        if stop.is_set():
+            raise asyncio.CancelledError
+        return await agent.run(question)
+
+    return asyncio.run(main())
+
+
+async def _run_offloaded(agent: Any, question: str) -> Any:
+    """
+    Run an offloaded agent in a worker thread with the sync-agent timeout.
+
+    On timeout (or caller cancellation) the thread's loop is cancelled and awaited,
+    so the caller keeps its concurrency slot until the thread has really stopped.
+    """
+    handle: concurrent.futures.Future = concurrent.futures.Future()
+    stop = threading.Event()
+    thread = asyncio.ensure_future(asyncio.to_thread(_run_on_own_loop, agent, question, handle, stop))
+
+    try:
+        return await asyncio.wait_for(asyncio.shield(thread), timeout=_SYNC_AGENT_TIMEOUT)
+    except BaseException:
+        stop.set()
+        if handle.done():
+            loop, task = handle.result()
+            loop.call_soon_threadsafe(task.cancel)
+        await asyncio.gather(thread, return_exceptions=True)
+        raise
 
 
 @app.post("/agents/consult")
@@ -579,16 +917,39 @@ async def consult_agents(request: ConsultRequest):
     if specialist not in agent_team:
         raise HTTPException(status_code=404, detail=f"Specialist '{specialist}' not found")
 
+    semaphore = _agent_semaphores[specialist]
+    if semaphore.locked() and _agent_waiting[specialist] >= _AGENT_MAX_WAITING:
+        # Fail fast rather than letting latency pile up behind a saturated agent
+        raise HTTPException(status_code=503, detail=f"Specialist '{specialist}' is overloaded")
+
     try:
         agent = agent_team[specialist]
-        result = await agent.run(request.question)
+
+        _agent_waiting[specialist] += 1
+        try:
+            await semaphore.acquire()
+        finally:
+            _agent_waiting[specialist] -= 1
+
+        try:
+            if specialist in _sync_agents:
+                result = await asyncio.wait_for(
+                    asyncio.to_thread(agent.run, request.question),
+                    timeout=_SYNC_AGENT_TIMEOUT
+                )
+            elif specialist in _offload_agents:
+                result = await _run_offloaded(agent, request.question)
+            else:
+                result = await agent.run(request.question)
+        finally:
+            semaphore.release()
 
         return {
             "answer": result,
             "specialist": specialist
         }
     except Exception as e:
-        logger.error(f"Agent consultation error: {e}")
+        logger.error("Agent consultation error: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -598,6 +959,8 @@ async def consult_agents(request: ConsultRequest):
 
 class RegisterServerRequest(BaseModel):
     """Request to register an external MCP server."""
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     name: str
     url: str
     description: str = ""
@@ -608,17 +971,29 @@ class RegisterServerRequest(BaseModel):
 
 class RouteRequest(BaseModel):
     """Request for intelligent routing."""
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     request: str
     context: Optional[dict] = None
 
 
-@app.post("/federation/register")
-async def register_mcp_server(req: RegisterServerRequest):
-    """Register an external MCP server for federation."""
-    if not federation_manager:
+async def require_federation() -> MCPFederationManager:
+    """Dependency returning the federation manager, or 503 before it is initialized.
+
+    Declared async so FastAPI calls it inline instead of in the threadpool.
+    """
+    if federation_manager is None:
         raise HTTPException(status_code=503, detail="Federation manager not initialized")
+    return federation_manager
+
 
-    success = await federation_manager.register_server(
+@app.post("/federation/register")
+async def register_mcp_server(
+    req: RegisterServerRequest,
+    fm: MCPFederationManager = Depends(require_federation)
+):
+    """Register an external MCP server for federation."""
+    success = await fm.register_server(
         name=req.name,
         url=req.url,
         description=req.description,
@@ -631,19 +1006,19 @@ async def register_mcp_server(req: RegisterServerRequest):
         return {
             "success": True,
             "message": f"Server {req.name} registered successfully",
-            "server": federation_manager.get_server_info(req.name)
+            "server": fm.get_server_info(req.name)
         }
     else:
         raise HTTPException(status_code=400, detail="Failed to register server")
 
 
 @app.delete("/federation/servers/{server_name}")
-async def unregister_mcp_server(server_name: str):
+async def unregister_mcp_server(
+    server_name: str,
+    fm: MCPFederationManager = Depends(require_federation)
+):
     """Unregister an MCP server."""
-    if not federation_manager:
-        raise HTTPException(status_code=503, detail="Federation manager not initialized")
-
-    success = await federation_manager.unregister_server(server_name)
+    success = await fm.unregister_server(server_name)
 
     if success:
         return {"success": True, "message": f"Server {server_name} unregistered"}
@@ -651,25 +1026,30 @@ async def unregister_mcp_server(server_name: str):
         raise HTTPException(status_code=404, detail="Server not found")
 
 
+# Encoded /federation/servers bodies by federation version; health fields change without
+# a version bump, so entries also expire after a few seconds
+_servers_bodies: TTLCache = TTLCache(maxsize=2, ttl=5)
+
+
 @app.get("/federation/servers")
-async def list_federated_servers():
+async def list_federated_servers(fm: MCPFederationManager = Depends(require_federation)):
     """List all registered MCP servers."""
-    if not federation_manager:
-        raise HTTPException(status_code=503, detail="Federation manager not initialized")
-
-    return {
-        "servers": federation_manager.list_servers(),
-        "stats": federation_manager.get_stats()
-    }
+    body = _servers_bodies.get(fm.version)
+    if body is None:
+        # get_stats already builds every server's info, so reuse it for the listing
+        stats = fm.get_stats()
+        body = orjson.dumps({"servers": stats["servers"], "stats": stats})
+        _servers_bodies[fm.version] = body
+    return Response(body, media_type="application/json")
 
 
 @app.get("/federation/servers/{server_name}")
-async def get_server_info(server_name: str):
+async def get_server_info(
+    server_name: str,
+    fm: MCPFederationManager = Depends(require_federation)
+):
     """Get detailed information about a specific MCP server."""
-    if not federation_manager:
-        raise HTTPException(status_code=503, detail="Federation manager not initialized")
-
-    info = federation_manager.get_server_info(server_name)
+    info = fm.get_server_info(server_name)
     if info:
         return info
     else:
@@ -689,40 +1069,77 @@ async def intelligent_route(req: RouteRequest):
         result = await router_agent.run(req.request, req.context)
         return result
     except Exception as e:
-        logger.error(f"Routing error: {e}")
+        logger.error("Routing error: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Encoded federation listings by kind, reused while the manager's version is unchanged
+# (it is bumped on register/unregister and whenever a server's capabilities change)
+_federated_bodies: Dict[str, Tuple[int, bytes]] = {}
+
+# Listings longer than this are streamed in slices instead of encoded (and kept) whole
+_FEDERATION_STREAM_THRESHOLD = 2000
+_FEDERATION_STREAM_SLICE = 100
+
+
+def _stream_listing(kind: str, listing: List[Dict]):
+    """Yield a {kind: [...], "total": n} body, encoding a slice of items at a time."""
+    yield b'{"' + kind.encode() + b'":['
+    for start in range(0, len(listing), _FEDERATION_STREAM_SLICE):
+        # Strip the brackets orjson puts around each slice
+        body = orjson.dumps(listing[start:start + _FEDERATION_STREAM_SLICE])[1:-1]
+        yield b"," + body if start else body
+    yield b'],"total":' + str(len(listing)).encode() + b"}"
+
+
+def _federated_listing(
+    fm: MCPFederationManager,
+    kind: str,
+    items: Callable[[], List[Dict]]
+) -> Response:
+    """Serve a federation listing, re-encoding only after the federation changes."""
+    version = fm.version
+    cached = _federated_bodies.get(kind)
+    if cached is None or cached[0] != version:
+        # The manager's list is cached and read-only, so slicing it while streaming is safe
+        listing = items()
+        if len(listing) > _FEDERATION_STREAM_THRESHOLD:
+            return StreamingResponse(_stream_listing(kind, listing), media_type="application/json")
+
+        cached = (version, orjson.dumps({kind: listing, "total": len(listing)}))
+        _federated_bodies[kind] = cached
+
+    return Response(cached[1], media_type="application/json")
+
+
 @app.get("/federation/tools")
-async def list_all_federated_tools():
+async def list_all_federated_tools(fm: MCPFederationManager = Depends(require_federation)):
     """List all tools from all federated servers (with namespacing)."""
-    if not federation_manager:
-        raise HTTPException(status_code=503, detail="Federation manager not initialized")
-
-    return {
-        "tools": federation_manager.get_all_tools(),
-        "total": len(federation_manager.get_all_tools())
-    }
+    return _federated_listing(fm, "tools", fm.get_all_tools)
 
 
 @app.get("/federation/resources")
-async def list_all_federated_resources():
+async def list_all_federated_resources(fm: MCPFederationManager = Depends(require_federation)):
     """List all resources from all federated servers (with namespacing)."""
-    if not federation_manager:
-        raise HTTPException(status_code=503, detail="Federation manager not initialized")
-
-    return {
-        "resources": federation_manager.get_all_resources(),
-        "total": len(federation_manager.get_all_resources())
-    }
+    return _federated_listing(fm, "resources", fm.get_all_resources)
 
 
 if __name__ == "__main__":
-    logger.info(f"🚀 Starting Northflank MCP Hub on port {PORT}")
+    logger.info("🚀 Starting Northflank MCP Hub on port %s", PORT)
+
+    # Federation state, agents and router caches live in-process, so default to a
+    # single worker; extra workers need the import string rather than the app object
+    workers = int(os.getenv("WEB_CONCURRENCY", "1"))
 
     uvicorn.run(
-        app,
+        app if workers == 1 else "server:app",
         host="0.0.0.0",
         port=PORT,
+        workers=workers,
+        loop=os.getenv("UVICORN_LOOP", "uvloop"),
+        http=os.getenv("UVICORN_HTTP", "httptools"),
+        limit_concurrency=int(os.getenv("UVICORN_LIMIT_CONCURRENCY", "1000")),
+        # Outlive typical 60 s load-balancer idle timeouts so pooled client connections are reused
+        timeout_keep_alive=int(os.getenv("UVICORN_TIMEOUT_KEEP_ALIVE", "75")),
         log_level="info"
     )
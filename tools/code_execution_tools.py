@@ -1,9 +1,131 @@
 """Code execution tools for MCP"""
-import subprocess
-import tempfile
-import os
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
 import asyncio
+import json
+import os
+import struct
+
+# Upper bound on code-execution subprocesses running at once; further calls wait
+_EXEC_SEMAPHORE = asyncio.Semaphore(int(os.getenv("CODE_EXEC_MAX_CONCURRENCY", "4")))
+
+# Warm python3 workers kept for execute_python; 0 (the default) spawns a fresh
+# interpreter per call. Pooled snippets get fresh globals but share imported modules,
+# so each worker is replaced after a bounded number of runs. Whoever enables the pool
+# owns shutdown: await CodeExecutionTools.close() when done (idle workers also exit on
+# their own once this process closes their stdin).
+_PYTHON_WORKERS = int(os.getenv("CODE_EXEC_PYTHON_WORKERS", "0"))
+_PYTHON_WORKER_MAX_RUNS = int(os.getenv("CODE_EXEC_PYTHON_WORKER_MAX_RUNS", "50"))
+
+_WORKER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "python_worker.py")
+_FRAME_HEADER = struct.Struct(">I")
+
+
+async def _communicate(
+    proc: asyncio.subprocess.Process,
+    stdin: Optional[bytes],
+    timeout: float
+) -> Tuple[int, str, str]:
+    """Wait for a subprocess without blocking the event loop, killing it on timeout."""
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(stdin), timeout=timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise
+
+    return proc.returncode, stdout.decode(errors="replace"), stderr.decode(errors="replace")
+
+
+class _PythonWorker:
+    """A long-lived python3 process running tools/python_worker.py."""
+
+    def __init__(self, proc: asyncio.subprocess.Process):
+        self.proc = proc
+        self.runs = 0
+
+    @classmethod
+    async def start(cls) -> "_PythonWorker":
+        proc = await asyncio.create_subprocess_exec(
+            'python3', '-u', _WORKER_SCRIPT,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+        return cls(proc)
+
+    async def run(self, code: str) -> Tuple[int, str, str]:
+        """Send one snippet and wait for its framed result."""
+        # Stdlib json on both ends: snippet output may hold lone surrogates orjson rejects
+        body = json.dumps({"code": code}).encode()
+        self.proc.stdin.write(_FRAME_HEADER.pack(len(body)) + body)
+        await self.proc.stdin.drain()
+
+        try:
+            header = await self.proc.stdout.readexactly(_FRAME_HEADER.size)
+            result = json.loads(await self.proc.stdout.readexactly(_FRAME_HEADER.unpack(header)[0]))
+        except asyncio.IncompleteReadError:
+            # The snippet ended the worker itself (e.g. os._exit); report its exit code
+            return await self.proc.wait(), "", ""
+
+        self.runs += 1
+        return result["returncode"], result["stdout"], result["stderr"]
+
+    async def kill(self):
+        if self.proc.returncode is None:
+            self.proc.kill()
+        await self.proc.wait()
+
+
+class PythonWorkerPool:
+    """Reuses warm python3 workers so execute_python skips interpreter startup."""
+
+    def __init__(self, size: int, max_runs: int):
+        self.size = size
+        self.max_runs = max_runs
+        self._idle: List[_PythonWorker] = []
+
+    async def acquire(self) -> _PythonWorker:
+        """Take an idle live worker, or start a new one."""
+        while self._idle:
+            worker = self._idle.pop()
+            if worker.proc.returncode is None:
+                return worker
+        return await _PythonWorker.start()
+
+    async def release(self, worker: _PythonWorker):
+        """Return a worker for reuse, retiring it once it has run enough snippets."""
+        if (
+            worker.proc.returncode is None
+            and worker.runs < self.max_runs
+            and len(self._idle) < self.size
+        ):
+            self._idle.append(worker)
+        else:
+            await worker.kill()
+
+    async def run(self, code: str, timeout: float) -> Tuple[int, str, str]:
+        """Run a snippet on a pooled worker, discarding the worker on timeout or error."""
+        worker = await self.acquire()
+        try:
+            result = await asyncio.wait_for(worker.run(code), timeout=timeout)
+        except BaseException:
+            # It may still be mid-snippet, so it must never be handed out again
+            await worker.kill()
+            raise
+        await self.release(worker)
+        return result
+
+    async def close(self):
+        """Stop all idle workers."""
+        idle, self._idle = self._idle, []
+        for worker in idle:
+            await worker.kill()
+
+
+_PYTHON_POOL: Optional[PythonWorkerPool] = (
+    PythonWorkerPool(_PYTHON_WORKERS, _PYTHON_WORKER_MAX_RUNS) if _PYTHON_WORKERS > 0 else None
+)
+
 
 class CodeExecutionTools:
     """Tools for executing code in various languages."""
@@ -11,52 +133,32 @@ class CodeExecutionTools:
     @staticmethod
     async def handle(name: str, arguments: Dict[str, Any]) -> str:
         """Handle code execution tool calls."""
-
-        if name == "execute_python":
-            return await CodeExecutionTools.execute_python(
-                arguments.get("code"),
-                arguments.get("timeout", 30)
-            )
-        elif name == "execute_javascript":
-            return await CodeExecutionTools.execute_javascript(
-                arguments.get("code"),
-                arguments.get("timeout", 30)
-            )
-        elif name == "execute_shell":
-            return await CodeExecutionTools.execute_shell(
-                arguments.get("command"),
-                arguments.get("timeout", 30)
-            )
-
-        return f"Unknown code execution tool: {name}"
+        handler = _HANDLERS.get(name)
+        if handler is None:
+            return f"Unknown code execution tool: {name}"
+        return await handler(arguments)
 
     @staticmethod
     async def execute_python(code: str, timeout: int = 30) -> str:
         """Execute Python code safely."""
         try:
-            # Create temporary file
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-                f.write(code)
-                temp_file = f.name
-
-            try:
-                # Execute with timeout
-                result = subprocess.run(
-                    ['python3', temp_file],
-                    capture_output=True,
-                    text=True,
-                    timeout=timeout
-                )
-
-                output = result.stdout if result.returncode == 0 else result.stderr
-                return f"Exit code: {result.returncode}\n\nOutput:\n{output}"
-
-            finally:
-                # Cleanup
-                if os.path.exists(temp_file):
-                    os.remove(temp_file)
-
-        except subprocess.TimeoutExpired:
+            async with _EXEC_SEMAPHORE:
+                if _PYTHON_POOL is not None:
+                    returncode, stdout, stderr = await _PYTHON_POOL.run(code, timeout)
+                else:
+                    # Code is piped through stdin, so nothing touches the filesystem
+                    proc = await asyncio.create_subprocess_exec(
+                        'python3', '-',
+                        stdin=asyncio.subprocess.PIPE,
+                        stdout=asyncio.subprocess.PIPE,
+                        stderr=asyncio.subprocess.PIPE
+                    )
+                    returncode, stdout, stderr = await _communicate(proc, code.encode(), timeout)
+
+            output = stdout if returncode == 0 else stderr
+            return f"Exit code: {returncode}\n\nOutput:\n{output}"
+
+        except asyncio.TimeoutError:
             return f"Execution timed out after {timeout} seconds"
         except Exception as e:
             return f"Execution error: {str(e)}"
@@ -65,29 +167,19 @@ class CodeExecutionTools:
     async def execute_javascript(code: str, timeout: int = 30) -> str:
         """Execute JavaScript/Node.js code safely."""
         try:
-            # Create temporary file
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.js', delete=False) as f:
-                f.write(code)
-                temp_file = f.name
-
-            try:
-                # Execute with timeout
-                result = subprocess.run(
-                    ['node', temp_file],
-                    capture_output=True,
-                    text=True,
-                    timeout=timeout
+            async with _EXEC_SEMAPHORE:
+                proc = await asyncio.create_subprocess_exec(
+                    'node', '-',
+                    stdin=asyncio.subprocess.PIPE,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE
                 )
+                returncode, stdout, stderr = await _communicate(proc, code.encode(), timeout)
 
-                output = result.stdout if result.returncode == 0 else result.stderr
-                return f"Exit code: {result.returncode}\n\nOutput:\n{output}"
-
-            finally:
-                # Cleanup
-                if os.path.exists(temp_file):
-                    os.remove(temp_file)
+            output = stdout if returncode == 0 else stderr
+            return f"Exit code: {returncode}\n\nOutput:\n{output}"
 
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             return f"Execution timed out after {timeout} seconds"
         except FileNotFoundError:
             return "Node.js not installed"
@@ -98,18 +190,43 @@ class CodeExecutionTools:
     async def execute_shell(command: str, timeout: int = 30) -> str:
         """Execute shell command safely."""
         try:
-            result = subprocess.run(
-                command,
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=timeout
-            )
-
-            output = result.stdout if result.returncode == 0 else result.stderr
-            return f"Exit code: {result.returncode}\n\nOutput:\n{output}"
-
-        except subprocess.TimeoutExpired:
+            async with _EXEC_SEMAPHORE:
+                proc = await asyncio.create_subprocess_shell(
+                    command,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE
+                )
+                returncode, stdout, stderr = await _communicate(proc, None, timeout)
+
+            output = stdout if returncode == 0 else stderr
+            return f"Exit code: {returncode}\n\nOutput:\n{output}"
+
+        except asyncio.TimeoutError:
             return f"Command timed out after {timeout} seconds"
         except Exception as e:
             return f"Execution error: {str(e)}"
+
+    @staticmethod
+    async def close():
+        """
+        Stop pooled Python workers.
+
+        Callers that enable CODE_EXEC_PYTHON_WORKERS must await this on shutdown;
+        neither server routes code-execution tools, so no lifespan calls it.
+        """
+        if _PYTHON_POOL is not None:
+            await _PYTHON_POOL.close()
+
+
+# Tool name -> coroutine factory taking the call arguments
+_HANDLERS = {
+    "execute_python": lambda args: CodeExecutionTools.execute_python(
+        args.get("code"), args.get("timeout", 30)
+    ),
+    "execute_javascript": lambda args: CodeExecutionTools.execute_javascript(
+        args.get("code"), args.get("timeout", 30)
+    ),
+    "execute_shell": lambda args: CodeExecutionTools.execute_shell(
+        args.get("command"), args.get("timeout", 30)
+    ),
+}
@@ -1,8 +1,18 @@
 """Database operation tools for MCP"""
-import os
-from typing import Dict, Any
+import asyncio
+import logging
+from typing import Dict, Any, List
 from motor.motor_asyncio import AsyncIOMotorClient
 import redis.asyncio as redis
+from config.settings import MONGO_URI, REDIS_URI
+
+logger = logging.getLogger(__name__)
+
+# Startup pings give up after this many seconds so an unreachable database cannot stall startup
+_CONNECT_TIMEOUT = 5.0
+
+# Projection for queries that only report whether or how many documents matched
+_ID_ONLY = {"_id": 1}
 
 class DatabaseTools:
     """Tools for database operations."""
@@ -10,45 +20,70 @@ class DatabaseTools:
     mongo_client = None
     redis_client = None
 
+    # Serialize first-time client creation so concurrent calls share one pool
+    _mongo_lock = asyncio.Lock()
+    _redis_lock = asyncio.Lock()
+
     @classmethod
     async def get_mongo_client(cls):
         """Get or create MongoDB client."""
         if cls.mongo_client is None:
-            mongo_uri = os.getenv("MONGO_URI")
-            if mongo_uri:
-                cls.mongo_client = AsyncIOMotorClient(mongo_uri)
+            async with cls._mongo_lock:
+                if cls.mongo_client is None:
+                    mongo_uri = MONGO_URI
+                    if mongo_uri:
+                        cls.mongo_client = AsyncIOMotorClient(mongo_uri, maxPoolSize=100)
         return cls.mongo_client
 
     @classmethod
     async def get_redis_client(cls):
         """Get or create Redis client."""
         if cls.redis_client is None:
-            redis_uri = os.getenv("REDIS_URI")
-            if redis_uri:
-                cls.redis_client = await redis.from_url(redis_uri)
+            async with cls._redis_lock:
+                if cls.redis_client is None:
+                    redis_uri = REDIS_URI
+                    if redis_uri:
+                        cls.redis_client = await redis.from_url(
+                            redis_uri, decode_responses=True, max_connections=200
+                        )
         return cls.redis_client
 
+    @classmethod
+    async def connect(cls):
+        """Open and ping the configured clients up front, so no request pays for it."""
+        await asyncio.gather(
+            cls._ping("MongoDB", cls.get_mongo_client, lambda client: client.admin.command("ping")),
+            cls._ping("Redis", cls.get_redis_client, lambda client: client.ping())
+        )
+
     @staticmethod
-    async def handle(name: str, arguments: Dict[str, Any]) -> str:
-        """Handle database tool calls."""
+    async def _ping(label: str, get_client, ping):
+        """Create one client and ping it, logging rather than raising on failure."""
+        try:
+            client = await get_client()
+            if client:
+                await asyncio.wait_for(ping(client), timeout=_CONNECT_TIMEOUT)
+                logger.info("✅ %s connected", label)
+        except Exception as e:
+            logger.error("❌ Error connecting to %s: %r", label, e)
 
-        if name == "mongo_query":
-            return await DatabaseTools.mongo_query(
-                arguments.get("collection"),
-                arguments.get("operation"),
-                arguments.get("query", {}),
-                arguments.get("options", {})
-            )
-        elif name == "redis_get":
-            return await DatabaseTools.redis_get(arguments.get("key"))
-        elif name == "redis_set":
-            return await DatabaseTools.redis_set(
-                arguments.get("key"),
-                arguments.get("value"),
-                arguments.get("ttl")
-            )
+    @classmethod
+    async def close(cls):
+        """Close database clients."""
+        if cls.redis_client:
+            await cls.redis_client.aclose()
+            cls.redis_client = None
+        if cls.mongo_client:
+            cls.mongo_client.close()
+            cls.mongo_client = None
 
-        return f"Unknown database tool: {name}"
+    @staticmethod
+    async def handle(name: str, arguments: Dict[str, Any]) -> str:
+        """Handle database tool calls."""
+        handler = _HANDLERS.get(name)
+        if handler is None:
+            return f"Unknown database tool: {name}"
+        return await handler(arguments)
 
     @staticmethod
     async def mongo_query(collection: str, operation: str, query: dict, options: dict) -> str:
@@ -63,11 +98,17 @@ class DatabaseTools:
 
             if operation == "find":
                 limit = options.get("limit", 10)
-                cursor = coll.find(query).limit(limit)
-                results = await cursor.to_list(length=limit)
-                return f"Found {len(results)} documents"
+                # Only the match count is reported, so fetch ids alone and count batches
+                # as they arrive rather than holding every document in memory
+                cursor = coll.find(query, _ID_ONLY).limit(limit)
+                if limit > 0:
+                    cursor = cursor.batch_size(min(limit, 500))
+                found = 0
+                async for _ in cursor:
+                    found += 1
+                return f"Found {found} documents"
             elif operation == "findOne":
-                result = await coll.find_one(query)
+                result = await coll.find_one(query, _ID_ONLY)
                 return f"Found: {result is not None}"
             elif operation == "count":
                 count = await coll.count_documents(query)
@@ -87,7 +128,23 @@ class DatabaseTools:
                 return "Redis not configured. Set REDIS_URI environment variable."
 
             value = await client.get(key)
-            return f"Value: {value.decode() if value else 'null'}"
+            return f"Value: {value if value is not None else 'null'}"
+        except Exception as e:
+            return f"Redis error: {str(e)}"
+
+    @staticmethod
+    async def redis_mget(keys: List[str]) -> str:
+        """Get several values from Redis in one round trip."""
+        try:
+            client = await DatabaseTools.get_redis_client()
+            if not client:
+                return "Redis not configured. Set REDIS_URI environment variable."
+
+            values = await client.mget(keys)
+            return "\n".join(
+                f"{key}: {value if value is not None else 'null'}"
+                for key, value in zip(keys, values)
+            )
         except Exception as e:
             return f"Redis error: {str(e)}"
 
@@ -107,3 +164,39 @@ class DatabaseTools:
             return f"Set {key} = {value}" + (f" (TTL: {ttl}s)" if ttl else "")
         except Exception as e:
             return f"Redis error: {str(e)}"
+
+    @staticmethod
+    async def redis_mset(items: Dict[str, str], ttl: int = None) -> str:
+        """Set several values in Redis with one pipelined round trip."""
+        try:
+            client = await DatabaseTools.get_redis_client()
+            if not client:
+                return "Redis not configured. Set REDIS_URI environment variable."
+
+            async with client.pipeline(transaction=False) as pipe:
+                for key, value in items.items():
+                    pipe.set(key, value, ex=ttl or None)
+                await pipe.execute()
+
+            return f"Set {len(items)} keys" + (f" (TTL: {ttl}s)" if ttl else "")
+        except Exception as e:
+            return f"Redis error: {str(e)}"
+
+
+# Tool name -> coroutine factory taking the call arguments
+_HANDLERS = {
+    "mongo_query": lambda args: DatabaseTools.mongo_query(
+        args.get("collection"),
+        args.get("operation"),
+        args.get("query", {}),
+        args.get("options", {})
+    ),
+    "redis_get": lambda args: DatabaseTools.redis_get(args.get("key")),
+    "redis_set": lambda args: DatabaseTools.redis_set(
+        args.get("key"), args.get("value"), args.get("ttl")
+    ),
+    "redis_mget": lambda args: DatabaseTools.redis_mget(args.get("keys", [])),
+    "redis_mset": lambda args: DatabaseTools.redis_mset(
+        args.get("items", {}), args.get("ttl")
+    ),
+}
@@ -1,5 +1,6 @@
 """Generic tools for calling any Northflank service"""
 import httpx
+from .http_client import get_http_client
 from typing import Dict, Any
 from .service_discovery import get_discovery
 
@@ -48,26 +49,26 @@ class GenericServiceTools:
             # Make the call
             full_url = f"{service_url}{endpoint}"
 
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                if method == "GET":
-                    response = await client.get(full_url)
-                elif method == "POST":
-                    response = await client.post(full_url, json=data or {})
-                elif method == "PUT":
-                    response = await client.put(full_url, json=data or {})
-                elif method == "DELETE":
-                    response = await client.delete(full_url)
-                else:
-                    return f"Unsupported method: {method}"
+            client = get_http_client()
+            if method == "GET":
+                response = await client.get(full_url)
+            elif method == "POST":
+                response = await client.post(full_url, json=data or {})
+            elif method == "PUT":
+                response = await client.put(full_url, json=data or {})
+            elif method == "DELETE":
+                response = await client.delete(full_url)
+            else:
+                return f"Unsupported method: {method}"
 
-                # Return response
-                if response.status_code == 200:
-                    try:
-                        return f"Success: {response.json()}"
-                    except:
-                        return f"Success: {response.text[:500]}"
-                else:
-                    return f"Service returned {response.status_code}: {response.text[:200]}"
+            # Return response
+            if response.status_code == 200:
+                try:
+                    return f"Success: {response.json()}"
+                except:
+                    return f"Success: {response.text[:500]}"
+            else:
+                return f"Service returned {response.status_code}: {response.text[:200]}"
 
         except httpx.TimeoutException:
             return f"Service '{service_name}' timed out"
@@ -4,6 +4,9 @@ import os
 from typing import Dict, Any
 import json
 
+# Porcelain index-status codes that mean a change is staged
+_STAGED_CODES = frozenset("MADRC")
+
 class GitTools:
     """Tools for Git operations."""
 
@@ -152,7 +155,7 @@ class GitTools:
                 status = line[:2]
                 filepath = line[3:]
 
-                if status[0] in ['M', 'A', 'D', 'R', 'C']:
+                if status[0] in _STAGED_CODES:
                     staged.append(f"{status[0]} {filepath}")
                 if status[1] == 'M':
                     modified.append(filepath)
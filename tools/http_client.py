@@ -0,0 +1,51 @@
+"""Shared HTTP clients for tool calls"""
+import aiohttp
+import httpx
+from typing import Optional
+
+_http_client: Optional[httpx.AsyncClient] = None
+_aiohttp_session: Optional[aiohttp.ClientSession] = None
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """Create a pooled client; per-request timeouts override the default."""
+    return httpx.AsyncClient(
+        timeout=30.0,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        http2=True
+    )
+
+
+def set_http_client(client: httpx.AsyncClient):
+    """Use the given client (e.g. one owned by the app lifespan) for tool calls."""
+    global _http_client
+    _http_client = client
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared httpx client, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = create_http_client()
+    return _http_client
+
+
+def get_aiohttp_session() -> aiohttp.ClientSession:
+    """Return the shared aiohttp session, creating it on first use (inside the event loop)."""
+    global _aiohttp_session
+    if _aiohttp_session is None or _aiohttp_session.closed:
+        _aiohttp_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, limit_per_host=20)
+        )
+    return _aiohttp_session
+
+
+async def close_http_clients():
+    """Close the shared clients so keep-alive connections are released."""
+    global _http_client, _aiohttp_session
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+    if _aiohttp_session is not None:
+        await _aiohttp_session.close()
+        _aiohttp_session = None
@@ -1,7 +1,7 @@
 """LibreChat integration tools for MCP"""
-import httpx
-import os
+from .http_client import get_http_client
 from typing import Dict, Any
+from config.settings import LIBRECHAT_URL
 
 class LibreChatTools:
     """Tools for LibreChat integration."""
@@ -24,24 +24,24 @@ class LibreChatTools:
     @staticmethod
     async def send_message(message: str, conversation_id: str = None, model: str = None) -> str:
         """Send message to LibreChat."""
-        librechat_url = os.getenv("LIBRECHAT_URL", "https://web--librechat--5d689c8h7r47.code.run")
+        librechat_url = LIBRECHAT_URL
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{librechat_url}/api/ask",
-                    json={
-                        "text": message,
-                        "conversationId": conversation_id,
-                        "model": model or "gpt-4"
-                    },
-                    timeout=30.0
-                )
+            client = get_http_client()
+            response = await client.post(
+                f"{librechat_url}/api/ask",
+                json={
+                    "text": message,
+                    "conversationId": conversation_id,
+                    "model": model or "gpt-4"
+                },
+                timeout=30.0
+            )
 
-                if response.status_code == 200:
-                    return f"Message sent successfully to LibreChat"
-                else:
-                    return f"Error: {response.status_code}"
+            if response.status_code == 200:
+                return f"Message sent successfully to LibreChat"
+            else:
+                return f"Error: {response.status_code}"
 
         except Exception as e:
             return f"LibreChat connection error: {str(e)}"
@@ -49,20 +49,20 @@ class LibreChatTools:
     @staticmethod
     async def get_config() -> str:
         """Get LibreChat configuration."""
-        librechat_url = os.getenv("LIBRECHAT_URL", "https://web--librechat--5d689c8h7r47.code.run")
+        librechat_url = LIBRECHAT_URL
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{librechat_url}/api/config",
-                    timeout=10.0
-                )
+            client = get_http_client()
+            response = await client.get(
+                f"{librechat_url}/api/config",
+                timeout=10.0
+            )
 
-                if response.status_code == 200:
-                    config = response.json()
-                    return f"LibreChat config loaded: {len(config)} settings"
-                else:
-                    return f"Error: {response.status_code}"
+            if response.status_code == 200:
+                config = response.json()
+                return f"LibreChat config loaded: {len(config)} settings"
+            else:
+                return f"Error: {response.status_code}"
 
         except Exception as e:
             return f"LibreChat connection error: {str(e)}"
@@ -1,9 +1,19 @@
 """MinIO object storage tools for MCP"""
-import os
-import httpx
-from typing import Dict, Any
+from .http_client import get_http_client
+from typing import Dict, Any, Optional, Tuple
+from config.settings import MINIO_URL, MINIO_ACCESS_KEY, MINIO_SECRET_KEY
 import base64
 
+_PUT_OK_STATUSES = frozenset((200, 201))
+
+
+def _minio_config() -> Optional[Tuple[str, Tuple[str, str]]]:
+    """MinIO endpoint and (access key, secret key) auth, or None if not configured."""
+    if not (MINIO_URL and MINIO_ACCESS_KEY and MINIO_SECRET_KEY):
+        return None
+    return MINIO_URL, (MINIO_ACCESS_KEY, MINIO_SECRET_KEY)
+
+
 class MinIOTools:
     """Tools for MinIO object storage operations."""
 
@@ -34,26 +44,23 @@ class MinIOTools:
     @staticmethod
     async def list_buckets() -> str:
         """List all MinIO buckets."""
-        # Support both MINIO_* and AWS_* environment variables
-        minio_url = os.getenv("MINIO_URL") or os.getenv("NF_MINIO_MINIO_ENDPOINT") or os.getenv("AWS_ENDPOINT_URL")
-        access_key = os.getenv("MINIO_ACCESS_KEY") or os.getenv("NF_MINIO_ACCESS_KEY") or os.getenv("AWS_ACCESS_KEY_ID")
-        secret_key = os.getenv("MINIO_SECRET_KEY") or os.getenv("NF_MINIO_SECRET_KEY") or os.getenv("AWS_SECRET_ACCESS_KEY")
-
-        if not all([minio_url, access_key, secret_key]):
+        config = _minio_config()
+        if config is None:
             return "MinIO not configured. Set MINIO_URL, MINIO_ACCESS_KEY, MINIO_SECRET_KEY."
+        minio_url, auth = config
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{minio_url}/",
-                    auth=(access_key, secret_key),
-                    timeout=10.0
-                )
-
-                if response.status_code == 200:
-                    return f"MinIO connected. Response: {response.text[:200]}"
-                else:
-                    return f"MinIO status: {response.status_code}"
+            client = get_http_client()
+            response = await client.get(
+                f"{minio_url}/",
+                auth=auth,
+                timeout=10.0
+            )
+
+            if response.status_code == 200:
+                return f"MinIO connected. Response: {response.text[:200]}"
+            else:
+                return f"MinIO status: {response.status_code}"
 
         except Exception as e:
             return f"MinIO error: {str(e)}"
@@ -61,22 +68,20 @@ class MinIOTools:
     @staticmethod
     async def list_objects(bucket: str) -> str:
         """List objects in a MinIO bucket."""
-        minio_url = os.getenv("MINIO_URL") or os.getenv("NF_MINIO_MINIO_ENDPOINT") or os.getenv("AWS_ENDPOINT_URL")
-        access_key = os.getenv("MINIO_ACCESS_KEY") or os.getenv("NF_MINIO_ACCESS_KEY") or os.getenv("AWS_ACCESS_KEY_ID")
-        secret_key = os.getenv("MINIO_SECRET_KEY") or os.getenv("NF_MINIO_SECRET_KEY") or os.getenv("AWS_SECRET_ACCESS_KEY")
-
-        if not all([minio_url, access_key, secret_key]):
+        config = _minio_config()
+        if config is None:
             return "MinIO not configured."
+        minio_url, auth = config
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{minio_url}/{bucket}/",
-                    auth=(access_key, secret_key),
-                    timeout=10.0
-                )
+            client = get_http_client()
+            response = await client.get(
+                f"{minio_url}/{bucket}/",
+                auth=auth,
+                timeout=10.0
+            )
 
-                return f"Bucket '{bucket}' objects: {response.text[:500]}"
+            return f"Bucket '{bucket}' objects: {response.text[:500]}"
 
         except Exception as e:
             return f"MinIO error: {str(e)}"
@@ -84,26 +89,24 @@ class MinIOTools:
     @staticmethod
     async def get_object(bucket: str, object_key: str) -> str:
         """Get an object from MinIO."""
-        minio_url = os.getenv("MINIO_URL") or os.getenv("NF_MINIO_MINIO_ENDPOINT") or os.getenv("AWS_ENDPOINT_URL")
-        access_key = os.getenv("MINIO_ACCESS_KEY") or os.getenv("NF_MINIO_ACCESS_KEY") or os.getenv("AWS_ACCESS_KEY_ID")
-        secret_key = os.getenv("MINIO_SECRET_KEY") or os.getenv("NF_MINIO_SECRET_KEY") or os.getenv("AWS_SECRET_ACCESS_KEY")
-
-        if not all([minio_url, access_key, secret_key]):
+        config = _minio_config()
+        if config is None:
             return "MinIO not configured."
+        minio_url, auth = config
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{minio_url}/{bucket}/{object_key}",
-                    auth=(access_key, secret_key),
-                    timeout=10.0
-                )
-
-                if response.status_code == 200:
-                    # Return size info instead of full content
-                    return f"Object '{object_key}': {len(response.content)} bytes"
-                else:
-                    return f"Error getting object: {response.status_code}"
+            client = get_http_client()
+            response = await client.get(
+                f"{minio_url}/{bucket}/{object_key}",
+                auth=auth,
+                timeout=10.0
+            )
+
+            if response.status_code == 200:
+                # Return size info instead of full content
+                return f"Object '{object_key}': {len(response.content)} bytes"
+            else:
+                return f"Error getting object: {response.status_code}"
 
         except Exception as e:
             return f"MinIO error: {str(e)}"
@@ -111,26 +114,24 @@ class MinIOTools:
     @staticmethod
     async def put_object(bucket: str, object_key: str, data: str) -> str:
         """Put an object into MinIO."""
-        minio_url = os.getenv("MINIO_URL") or os.getenv("NF_MINIO_MINIO_ENDPOINT") or os.getenv("AWS_ENDPOINT_URL")
-        access_key = os.getenv("MINIO_ACCESS_KEY") or os.getenv("NF_MINIO_ACCESS_KEY") or os.getenv("AWS_ACCESS_KEY_ID")
-        secret_key = os.getenv("MINIO_SECRET_KEY") or os.getenv("NF_MINIO_SECRET_KEY") or os.getenv("AWS_SECRET_ACCESS_KEY")
-
-        if not all([minio_url, access_key, secret_key]):
+        config = _minio_config()
+        if config is None:
             return "MinIO not configured."
+        minio_url, auth = config
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.put(
-                    f"{minio_url}/{bucket}/{object_key}",
-                    content=data.encode() if isinstance(data, str) else data,
-                    auth=(access_key, secret_key),
-                    timeout=30.0
-                )
-
-                if response.status_code in [200, 201]:
-                    return f"Object '{object_key}' uploaded successfully"
-                else:
-                    return f"Error uploading: {response.status_code}"
+            client = get_http_client()
+            response = await client.put(
+                f"{minio_url}/{bucket}/{object_key}",
+                content=data.encode() if isinstance(data, str) else data,
+                auth=auth,
+                timeout=30.0
+            )
+
+            if response.status_code in _PUT_OK_STATUSES:
+                return f"Object '{object_key}' uploaded successfully"
+            else:
+                return f"Error uploading: {response.status_code}"
 
         except Exception as e:
             return f"MinIO error: {str(e)}"
@@ -1,5 +1,6 @@
 """MS Agent Team interaction tools for MCP"""
 import aiohttp
+from .http_client import get_aiohttp_session
 import os
 from typing import Dict, Any
 import json
@@ -40,37 +41,37 @@ class MSAgentTeamTools:
             if not message:
                 return "Error: Message is required"
 
-            async with aiohttp.ClientSession() as session:
-                url = f"{MSAgentTeamTools.BASE_URL}/consult"
-
-                # The service expects "question" and "specialist" fields
-                payload = {
-                    "question": message,
-                    "specialist": context.get("specialist") if context else None
-                }
-
-                try:
-                    async with session.post(
-                        url,
-                        json=payload,
-                        headers={"Content-Type": "application/json"},
-                        timeout=aiohttp.ClientTimeout(total=60)
-                    ) as response:
-                        if response.status == 200:
-                            result = await response.json()
-                            # Extract the answer from the response
-                            answer = result.get("answer", result)
-                            specialist = result.get("specialist", "unknown")
-
-                            return f"🤖 Agent Team Response (Specialist: {specialist}):\n\n{answer}"
-                        else:
-                            text = await response.text()
-                            return f"Error: HTTP {response.status}\n{text[:500]}"
-
-                except aiohttp.ClientTimeout:
-                    return "Error: Request timed out after 60 seconds. The agent team may be processing a complex query."
-                except Exception as e:
-                    return f"Error connecting to agent team: {str(e)}"
+            session = get_aiohttp_session()
+            url = f"{MSAgentTeamTools.BASE_URL}/consult"
+
+            # The service expects "question" and "specialist" fields
+            payload = {
+                "question": message,
+                "specialist": context.get("specialist") if context else None
+            }
+
+            try:
+                async with session.post(
+                    url,
+                    json=payload,
+                    headers={"Content-Type": "application/json"},
+                    timeout=aiohttp.ClientTimeout(total=60)
+                ) as response:
+                    if response.status == 200:
+                        result = await response.json()
+                        # Extract the answer from the response
+                        answer = result.get("answer", result)
+                        specialist = result.get("specialist", "unknown")
+
+                        return f"🤖 Agent Team Response (Specialist: {specialist}):\n\n{answer}"
+                    else:
+                        text = await response.text()
+                        return f"Error: HTTP {response.status}\n{text[:500]}"
+
+            except aiohttp.ClientTimeout:
+                return "Error: Request timed out after 60 seconds. The agent team may be processing a complex query."
+            except Exception as e:
+                return f"Error connecting to agent team: {str(e)}"
 
         except Exception as e:
             return f"Error chatting with agent team: {str(e)}"
@@ -79,28 +80,28 @@ class MSAgentTeamTools:
     async def get_status() -> str:
         """Get the status of the agent team service."""
         try:
-            async with aiohttp.ClientSession() as session:
-                endpoints = ["/health", "/status", "/api/health", "/"]
-
-                for endpoint in endpoints:
-                    url = f"{MSAgentTeamTools.BASE_URL}{endpoint}"
-
-                    try:
-                        async with session.get(
-                            url,
-                            timeout=aiohttp.ClientTimeout(total=10)
-                        ) as response:
-                            if response.status == 200:
-                                try:
-                                    result = await response.json()
-                                    return f"Agent Team Status (via {endpoint}):\n{json.dumps(result, indent=2)}"
-                                except:
-                                    text = await response.text()
-                                    return f"Agent Team Status (via {endpoint}):\n{text[:500]}"
-                    except:
-                        continue
-
-                return "Error: Could not reach agent team service status endpoint"
+            session = get_aiohttp_session()
+            endpoints = ["/health", "/status", "/api/health", "/"]
+
+            for endpoint in endpoints:
+                url = f"{MSAgentTeamTools.BASE_URL}{endpoint}"
+
+                try:
+                    async with session.get(
+                        url,
+                        timeout=aiohttp.ClientTimeout(total=10)
+                    ) as response:
+                        if response.status == 200:
+                            try:
+                                result = await response.json()
+                                return f"Agent Team Status (via {endpoint}):\n{json.dumps(result, indent=2)}"
+                            except:
+                                text = await response.text()
+                                return f"Agent Team Status (via {endpoint}):\n{text[:500]}"
+                except:
+                    continue
+
+            return "Error: Could not reach agent team service status endpoint"
 
         except Exception as e:
             return f"Error getting status: {str(e)}"
@@ -109,24 +110,24 @@ class MSAgentTeamTools:
     async def list_agents() -> str:
         """List all available agents in the team."""
         try:
-            async with aiohttp.ClientSession() as session:
-                endpoints = ["/agents", "/api/agents", "/agents/list", "/list"]
-
-                for endpoint in endpoints:
-                    url = f"{MSAgentTeamTools.BASE_URL}{endpoint}"
-
-                    try:
-                        async with session.get(
-                            url,
-                            timeout=aiohttp.ClientTimeout(total=10)
-                        ) as response:
-                            if response.status == 200:
-                                result = await response.json()
-                                return f"Available Agents:\n{json.dumps(result, indent=2)}"
-                    except:
-                        continue
+            session = get_aiohttp_session()
+            endpoints = ["/agents", "/api/agents", "/agents/list", "/list"]
+
+            for endpoint in endpoints:
+                url = f"{MSAgentTeamTools.BASE_URL}{endpoint}"
+
+                try:
+                    async with session.get(
+                        url,
+                        timeout=aiohttp.ClientTimeout(total=10)
+                    ) as response:
+                        if response.status == 200:
+                            result = await response.json()
+                            return f"Available Agents:\n{json.dumps(result, indent=2)}"
+                except:
+                    continue
 
-                return "Error: Could not find agents list endpoint"
+            return "Error: Could not find agents list endpoint"
 
         except Exception as e:
             return f"Error listing agents: {str(e)}"
@@ -138,36 +139,36 @@ class MSAgentTeamTools:
             if not agent_name or not query:
                 return "Error: Both agent_name and query are required"
 
-            async with aiohttp.ClientSession() as session:
-                url = f"{MSAgentTeamTools.BASE_URL}/consult"
-
-                # Use the specialist parameter to target specific agent
-                payload = {
-                    "question": query,
-                    "specialist": agent_name
-                }
-
-                try:
-                    async with session.post(
-                        url,
-                        json=payload,
-                        headers={"Content-Type": "application/json"},
-                        timeout=aiohttp.ClientTimeout(total=60)
-                    ) as response:
-                        if response.status == 200:
-                            result = await response.json()
-                            answer = result.get("answer", result)
-                            specialist = result.get("specialist", agent_name)
-
-                            return f"🎯 Agent '{specialist}' Response:\n\n{answer}"
-                        else:
-                            text = await response.text()
-                            return f"Error: HTTP {response.status}\n{text[:500]}"
-
-                except aiohttp.ClientTimeout:
-                    return f"Error: Request to agent '{agent_name}' timed out after 60 seconds."
-                except Exception as e:
-                    return f"Error connecting to agent '{agent_name}': {str(e)}"
+            session = get_aiohttp_session()
+            url = f"{MSAgentTeamTools.BASE_URL}/consult"
+
+            # Use the specialist parameter to target specific agent
+            payload = {
+                "question": query,
+                "specialist": agent_name
+            }
+
+            try:
+                async with session.post(
+                    url,
+                    json=payload,
+                    headers={"Content-Type": "application/json"},
+                    timeout=aiohttp.ClientTimeout(total=60)
+                ) as response:
+                    if response.status == 200:
+                        result = await response.json()
+                        answer = result.get("answer", result)
+                        specialist = result.get("specialist", agent_name)
+
+                        return f"🎯 Agent '{specialist}' Response:\n\n{answer}"
+                    else:
+                        text = await response.text()
+                        return f"Error: HTTP {response.status}\n{text[:500]}"
+
+            except aiohttp.ClientTimeout:
+                return f"Error: Request to agent '{agent_name}' timed out after 60 seconds."
+            except Exception as e:
+                return f"Error connecting to agent '{agent_name}': {str(e)}"
 
         except Exception as e:
             return f"Error querying agent: {str(e)}"
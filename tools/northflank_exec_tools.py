@@ -3,6 +3,7 @@ import subprocess
 import os
 from typing import Dict, Any
 import json
+import orjson
 
 class NorthflankExecTools:
     """Tools for executing commands on Northflank services."""
@@ -172,7 +173,7 @@ class NorthflankExecTools:
             )
 
             if result.returncode == 0:
-                data = json.loads(result.stdout)
+                data = orjson.loads(result.stdout)
                 info = {
                     "id": data.get("data", {}).get("id"),
                     "name": data.get("data", {}).get("name"),
@@ -1,7 +1,7 @@
 """PostgreSQL operation tools for MCP"""
-import os
 import asyncpg
 from typing import Dict, Any, Optional
+from config.settings import POSTGRES_URI
 
 class PostgresTools:
     """Tools for PostgreSQL operations."""
@@ -12,7 +12,7 @@ class PostgresTools:
     async def get_pool(cls) -> Optional[asyncpg.Pool]:
         """Get or create PostgreSQL connection pool."""
         if cls.pool is None:
-            postgres_uri = os.getenv("POSTGRES_URI")
+            postgres_uri = POSTGRES_URI
             if postgres_uri:
                 try:
                     cls.pool = await asyncpg.create_pool(
@@ -0,0 +1,62 @@
+"""Long-lived Python worker for the execute_python warm pool.
+
+Reads length-prefixed JSON requests ({"code": ...}) from stdin and answers each one
+with {"returncode", "stdout", "stderr"} on stdout, running every snippet in a fresh
+globals dict. Not imported by the server; started as `python3 -u python_worker.py`.
+"""
+import contextlib
+import io
+import json
+import os
+import struct
+import sys
+import traceback
+
+_HEADER = struct.Struct(">I")
+
+
+def _run(code: str):
+    """Execute a snippet the way `python3 -` would, capturing its output."""
+    out, err = io.StringIO(), io.StringIO()
+    returncode = 0
+
+    with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+        try:
+            exec(compile(code, "<stdin>", "exec"), {"__name__": "__main__", "__builtins__": __builtins__})
+        except SystemExit as e:
+            if e.code is None or isinstance(e.code, int):
+                returncode = e.code or 0
+            else:
+                print(e.code, file=sys.stderr)
+                returncode = 1
+        except BaseException:
+            # Drop this frame so the traceback starts at the snippet
+            etype, value, tb = sys.exc_info()
+            traceback.print_exception(etype, value, tb.tb_next)
+            returncode = 1
+
+    return {"returncode": returncode, "stdout": out.getvalue(), "stderr": err.getvalue()}
+
+
+def main():
+    # Keep the protocol on private descriptors so snippets writing to fd 0/1 cannot corrupt it
+    requests = os.fdopen(os.dup(0), "rb")
+    responses = os.fdopen(os.dup(1), "wb")
+    devnull = os.open(os.devnull, os.O_RDWR)
+    os.dup2(devnull, 0)
+    os.dup2(devnull, 1)
+
+    while True:
+        header = requests.read(_HEADER.size)
+        if len(header) < _HEADER.size:
+            return
+        (size,) = _HEADER.unpack(header)
+        code = json.loads(requests.read(size))["code"]
+
+        body = json.dumps(_run(code)).encode()
+        responses.write(_HEADER.pack(len(body)) + body)
+        responses.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,8 @@
 """RabbitMQ message queue tools for MCP"""
-import os
 import aio_pika
-import json
+import orjson
 from typing import Dict, Any, Optional
+from config.settings import RABBITMQ_URI
 
 class RabbitMQTools:
     """Tools for RabbitMQ message queue operations."""
@@ -14,7 +14,7 @@ class RabbitMQTools:
     async def get_connection(cls):
         """Get or create RabbitMQ connection."""
         if cls.connection is None or cls.connection.is_closed:
-            rabbitmq_url = os.getenv("RABBITMQ_URI")
+            rabbitmq_url = RABBITMQ_URI
             if rabbitmq_url:
                 try:
                     cls.connection = await aio_pika.connect_robust(
@@ -68,7 +68,7 @@ class RabbitMQTools:
             await channel.declare_queue(queue, durable=True)
 
             # Publish message
-            message_body = json.dumps(message).encode()
+            message_body = orjson.dumps(message)
             await channel.default_exchange.publish(
                 aio_pika.Message(body=message_body),
                 routing_key=queue
@@ -2,14 +2,32 @@
 Auto-discovery for Northflank services and addons
 """
 import os
+import asyncio
 import subprocess
-import json
+import orjson
 import logging
 from typing import Dict, List, Any, Optional
 
 logger = logging.getLogger(__name__)
 
 
+async def _run_cli(*args: str, timeout: float = 10) -> subprocess.CompletedProcess:
+    """Run the northflank CLI without blocking the event loop (stdout is left as bytes)."""
+    proc = await asyncio.create_subprocess_exec(
+        "northflank", *args,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise
+
+    return subprocess.CompletedProcess(args, proc.returncode, stdout, stderr.decode(errors="replace"))
+
+
 class ServiceDiscovery:
     """Automatically discover and register Northflank services."""
 
@@ -31,97 +49,94 @@ class ServiceDiscovery:
                 "total_addons": len(addons)
             }
         except Exception as e:
-            logger.error(f"Discovery failed: {e}")
+            logger.error("Discovery failed: %s", e)
             return {"error": str(e)}
 
     async def discover_services(self) -> List[Dict[str, Any]]:
         """Discover all services in the project."""
-        if self._services_cache:
+        if self._services_cache is not None:
             return self._services_cache
 
         try:
-            # Use northflank CLI to list services
-            result = subprocess.run(
-                ["northflank", "list", "services", "--project", self.project_id, "--output", "json"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-
-            if result.returncode == 0:
-                data = json.loads(result.stdout)
-                services = data.get("data", {}).get("services", [])
-
-                # Extract useful service info
-                service_list = []
-                for svc in services:
-                    service_info = {
-                        "id": svc.get("id"),
-                        "name": svc.get("name"),
-                        "description": svc.get("description", ""),
-                        "type": svc.get("serviceType", "unknown"),
-                        "status": svc.get("status", {}).get("deployment", {}).get("status"),
-                        "ports": svc.get("ports", []),
-                        "dns": None
-                    }
-
-                    # Extract DNS from ports
-                    if service_info["ports"]:
-                        for port in service_info["ports"]:
-                            if port.get("dns"):
-                                service_info["dns"] = f"https://{port['dns']}"
-                                break
-
-                    service_list.append(service_info)
-
-                self._services_cache = service_list
-                return service_list
-            else:
-                logger.warning(f"Failed to list services: {result.stderr}")
-                return []
-
+            return await self.refresh_services()
         except Exception as e:
-            logger.error(f"Service discovery error: {e}")
+            logger.error("Service discovery error: %s", e)
             return []
 
+    async def refresh_services(self) -> List[Dict[str, Any]]:
+        """
+        Re-list services, replacing the cache only on success.
+
+        Raises if the CLI fails, so callers can tell a failed discovery from
+        a project with no services and keep their last good results.
+        """
+        # Use northflank CLI to list services
+        result = await _run_cli("list", "services", "--project", self.project_id, "--output", "json")
+        if result.returncode != 0:
+            raise RuntimeError(f"Failed to list services: {result.stderr}")
+
+        data = orjson.loads(result.stdout)
+        services = data.get("data", {}).get("services", [])
+
+        # Extract useful service info
+        service_list = []
+        for svc in services:
+            service_info = {
+                "id": svc.get("id"),
+                "name": svc.get("name"),
+                "description": svc.get("description", ""),
+                "type": svc.get("serviceType", "unknown"),
+                "status": svc.get("status", {}).get("deployment", {}).get("status"),
+                "ports": svc.get("ports", []),
+                "dns": None
+            }
+
+            # Extract DNS from ports
+            if service_info["ports"]:
+                for port in service_info["ports"]:
+                    if port.get("dns"):
+                        service_info["dns"] = f"https://{port['dns']}"
+                        break
+
+            service_list.append(service_info)
+
+        self._services_cache = service_list
+        return service_list
+
     async def discover_addons(self) -> List[Dict[str, Any]]:
         """Discover all addons (databases, caches, etc.) in the project."""
-        if self._addons_cache:
+        if self._addons_cache is not None:
             return self._addons_cache
 
         try:
-            result = subprocess.run(
-                ["northflank", "list", "addons", "--project", self.project_id, "--output", "json"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-
-            if result.returncode == 0:
-                data = json.loads(result.stdout)
-                addons = data.get("data", {}).get("addons", [])
-
-                addon_list = []
-                for addon in addons:
-                    addon_info = {
-                        "id": addon.get("id"),
-                        "name": addon.get("name"),
-                        "type": addon.get("spec", {}).get("type"),
-                        "status": addon.get("status"),
-                        "description": addon.get("description", "")
-                    }
-                    addon_list.append(addon_info)
-
-                self._addons_cache = addon_list
-                return addon_list
-            else:
-                logger.warning(f"Failed to list addons: {result.stderr}")
-                return []
-
+            return await self.refresh_addons()
         except Exception as e:
-            logger.error(f"Addon discovery error: {e}")
+            logger.error("Addon discovery error: %s", e)
             return []
 
+    async def refresh_addons(self) -> List[Dict[str, Any]]:
+        """Re-list addons, replacing the cache only on success (raises if the CLI fails)."""
+        result = await _run_cli("list", "addons", "--project", self.project_id, "--output", "json")
+        if result.returncode != 0:
+            raise RuntimeError(f"Failed to list addons: {result.stderr}")
+
+        data = orjson.loads(result.stdout)
+        addons = data.get("data", {}).get("addons", [])
+
+        addon_list = []
+        for addon in addons:
+            addon_info = {
+                "id": addon.get("id"),
+                "name": addon.get("name"),
+                "type": addon.get("spec", {}).get("type"),
+                "status": addon.get("status"),
+                "description": addon.get("description", "")
+            }
+            addon_list.append(addon_info)
+
+        self._addons_cache = addon_list
+        return addon_list
+
     async def get_service_url(self, service_name: str) -> Optional[str]:
         """Get the URL for a specific service."""
         services = await self.discover_services()
@@ -161,7 +176,11 @@ class ServiceDiscovery:
 
     async def generate_service_tools(self) -> List[Dict[str, Any]]:
         """Generate MCP tools dynamically based on discovered services."""
-        services = await self.discover_services()
+        return self.build_service_tools(await self.discover_services())
+
+    @staticmethod
+    def build_service_tools(services: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Generate one MCP tool per discovered service."""
         tools = []
 
         for svc in services:
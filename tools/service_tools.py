@@ -1,5 +1,5 @@
 """Service coordination tools for MCP"""
-import httpx
+from .http_client import get_http_client
 import os
 from typing import Dict, Any
 
@@ -52,14 +52,14 @@ class ServiceTools:
         }
 
         results = []
-        async with httpx.AsyncClient() as client:
-            for name, url in services.items():
-                try:
-                    resp = await client.get(url, timeout=5.0)
-                    status = "✅ Healthy" if resp.status_code == 200 else "⚠️ Issues"
-                    results.append(f"{name}: {status}")
-                except Exception as e:
-                    results.append(f"{name}: ❌ Down - {str(e)[:50]}")
+        client = get_http_client()
+        for name, url in services.items():
+            try:
+                resp = await client.get(url, timeout=5.0)
+                status = "✅ Healthy" if resp.status_code == 200 else "⚠️ Issues"
+                results.append(f"{name}: {status}")
+            except Exception as e:
+                results.append(f"{name}: ❌ Down - {str(e)[:50]}")
 
         return "\n".join(results)
 